@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 import text_log
-import sound_manager
 
 # Durability model defaults
 DEFAULT_ATTACK_CHANCE = 0.6
@@ -15,8 +14,40 @@ DEFAULT_ESCAPE_CHANCE = 0.5
 DEFAULT_DURABILITY = 3
 DEFAULT_MAX_TURNS = 3
 
+_rand = random.random
 
-@dataclass
+# 音效與日誌出口；預設延遲載入 sound_manager，無頭模擬可換成空函式
+_play_sfx: Optional[Callable[[str], None]] = None
+_log_add: Callable[..., None] = text_log.add
+
+
+def _noop(*args, **kwargs) -> None:
+    return None
+
+
+def _sfx(name: str) -> None:
+    global _play_sfx
+    if _play_sfx is None:
+        import sound_manager  # pulls in pygame; only load when a sound plays
+
+        _play_sfx = sound_manager.play_sfx
+    _play_sfx(name)
+
+
+def set_sfx(callback: Optional[Callable[[str], None]]) -> None:
+    """Override how battle sounds are played; ``None`` restores sound_manager."""
+    global _play_sfx
+    _play_sfx = callback
+
+
+def set_headless(enabled: bool = True) -> None:
+    """Silence battle sounds and log output for batch simulations."""
+    global _log_add
+    set_sfx(_noop if enabled else None)
+    _log_add = _noop if enabled else text_log.add
+
+
+@dataclass(slots=True)
 class EnemyState:
     """Internal representation of an enemy in battle."""
 
@@ -29,8 +60,46 @@ class EnemyState:
         )
 
 
-def _ensure_battle_state(player: Dict) -> Dict:
-    return player.setdefault("battle_state", {})
+@dataclass(slots=True)
+class BattleState:
+    """Per-battle counters stored on ``player["battle_state"]``."""
+
+    enemy: EnemyState
+    event_id: Optional[str] = None
+    active: bool = True
+    escaped: bool = False
+    victory: bool = False
+    defeat: bool = False
+    turn_count: int = 0
+    attack_attempts: int = 0
+    escape_attempts: int = 0
+    max_turns: int = DEFAULT_MAX_TURNS
+    durability: int = DEFAULT_DURABILITY
+    max_durability: int = DEFAULT_DURABILITY
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "BattleState":
+        """Rebuild state from a saved (or legacy) battle_state dict."""
+        enemy = data.get("enemy")
+        if not isinstance(enemy, EnemyState):
+            enemy = EnemyState.from_dict(enemy if isinstance(enemy, dict) else {})
+        durability = data.get("durability", DEFAULT_DURABILITY)
+        return cls(
+            enemy=enemy,
+            event_id=data.get("event_id"),
+            active=bool(data.get("active")),
+            escaped=bool(data.get("escaped")),
+            victory=bool(data.get("victory")),
+            defeat=bool(data.get("defeat")),
+            turn_count=data.get("turn_count", 0),
+            attack_attempts=data.get("attack_attempts", 0),
+            escape_attempts=data.get("escape_attempts", 0),
+            max_turns=data.get("max_turns", DEFAULT_MAX_TURNS),
+            durability=durability,
+            max_durability=data.get(
+                "max_durability", durability or DEFAULT_DURABILITY
+            ),
+        )
 
 
 def start_battle(player: Dict, event: Dict) -> None:
@@ -41,66 +110,62 @@ def start_battle(player: Dict, event: Dict) -> None:
         # Backwards compatibility with older story fields.
         enemy_data = {"name": event.get("enemy_name", "未知生物")}
 
-    state = _ensure_battle_state(player)
     enemy = EnemyState.from_dict(enemy_data)
     durability = int(event.get("battle_durability", DEFAULT_DURABILITY))
     max_turns = int(event.get("battle_max_turns", DEFAULT_MAX_TURNS))
     durability = durability if durability > 0 else DEFAULT_DURABILITY
     max_turns = max_turns if max_turns > 0 else DEFAULT_MAX_TURNS
 
-    state.update(
-        {
-            "event_id": event.get("id"),
-            "enemy": enemy,
-            "active": True,
-            "escaped": False,
-            "victory": False,
-            "defeat": False,
-            "turn_count": 0,
-            "attack_attempts": 0,
-            "escape_attempts": 0,
-            "max_turns": max_turns,
-            "durability": durability,
-            "max_durability": durability,
-        }
+    state = BattleState(
+        enemy=enemy,
+        event_id=event.get("id"),
+        max_turns=max_turns,
+        durability=durability,
+        max_durability=durability,
     )
+    player["battle_state"] = state
 
-    text_log.add(f"戰鬥開始：{enemy.name}", category="system")
-    text_log.add(f"可承受失敗次數：{state['durability']}", category="system")
+    _log_add(f"戰鬥開始：{enemy.name}", category="system")
+    _log_add(f"可承受失敗次數：{state.durability}", category="system")
 
 
 def clear_battle_state(player: Dict) -> None:
     """Remove any cached battle state from the player."""
 
-    if "battle_state" in player:
-        player["battle_state"].clear()
-        del player["battle_state"]
+    player.pop("battle_state", None)
 
 
-def get_battle_state(player: Dict) -> Optional[Dict]:
+def get_battle_state(player: Dict) -> Optional[BattleState]:
     state = player.get("battle_state")
     if not state:
         return None
-    enemy = state.get("enemy")
-    if enemy and isinstance(enemy, dict):
-        # Convert legacy enemy dicts into EnemyState.
-        state["enemy"] = EnemyState.from_dict(enemy)
-    return state
+    if isinstance(state, BattleState):
+        return state
+    if not isinstance(state, dict):
+        return None
+    # Convert saved/legacy dicts into BattleState once.
+    hydrated = BattleState.from_dict(state)
+    player["battle_state"] = hydrated
+    return hydrated
 
 
 def is_battle_active(player: Dict) -> bool:
     state = get_battle_state(player)
-    return bool(state and state.get("active"))
+    return bool(state and state.active)
 
 
 def perform_battle_action(
-    player: Dict, action: str, config: Optional[Dict] = None
+    player: Dict, action: str, config: Optional[Dict] = None, *, verbose: bool = True
 ) -> Dict:
-    """Execute one turn of a durability-based battle and return the outcome."""
+    """Execute one turn of a durability-based battle and return the outcome.
+
+    Pass ``verbose=False`` from headless simulations to skip building the
+    narration messages; the returned ``messages`` list is then empty.
+    """
 
     config = config or {}
     state = get_battle_state(player)
-    if not state or not state.get("active"):
+    if not state or not state.active:
         return {
             "messages": ["現在沒有正在進行的戰鬥。"],
             "battle_over": True,
@@ -108,10 +173,10 @@ def perform_battle_action(
             "enemy_damage": 0,
         }
 
-    enemy: EnemyState = state["enemy"]
-    max_turns = max(state.get("max_turns", DEFAULT_MAX_TURNS), 1)
-    durability = max(state.get("durability", DEFAULT_DURABILITY), 0)
-    max_durability = max(state.get("max_durability", durability or DEFAULT_DURABILITY), 1)
+    enemy = state.enemy
+    max_turns = max(state.max_turns, 1)
+    durability = max(state.durability, 0)
+    max_durability = max(state.max_durability, 1)
 
     messages: list[str] = []
     battle_over = False
@@ -120,62 +185,67 @@ def perform_battle_action(
     defeat = False
     durability_loss = 0
 
-    state["turn_count"] = state.get("turn_count", 0) + 1
+    state.turn_count += 1
 
     if action == "attack":
-        state["attack_attempts"] = state.get("attack_attempts", 0) + 1
-        attempt = state["attack_attempts"]
+        state.attack_attempts += 1
+        attempt = state.attack_attempts
         chance = float(config.get("attack_chance", DEFAULT_ATTACK_CHANCE))
-        success = attempt >= max_turns or random.random() < chance
+        success = attempt >= max_turns or _rand() < chance
         if success:
-            messages.append(f"你擊倒了 {enemy.name}！")
+            if verbose:
+                messages.append(f"你擊倒了 {enemy.name}！")
             battle_over = True
             victory = True
-            sound_manager.play_sfx("monster_death")
+            _sfx("monster_death")
         else:
             durability_loss = 1
             durability = max(0, durability - durability_loss)
-            messages.append("攻擊未能奏效，你的耐久下降。")
-            messages.append(f"耐久 {durability}/{max_durability}")
+            if verbose:
+                messages.append("攻擊未能奏效，你的耐久下降。")
+                messages.append(f"耐久 {durability}/{max_durability}")
 
     elif action == "escape":
-        state["escape_attempts"] = state.get("escape_attempts", 0) + 1
-        attempt = state["escape_attempts"]
+        state.escape_attempts += 1
+        attempt = state.escape_attempts
         base_chance = float(config.get("escape_chance", DEFAULT_ESCAPE_CHANCE))
         incremental = max(0.0, 0.15 * (attempt - 1))
         chance = 1.0 if attempt >= max_turns else min(1.0, base_chance + incremental)
-        if random.random() < chance:
-            messages.append("你成功脫離戰鬥。")
+        if _rand() < chance:
+            if verbose:
+                messages.append("你成功脫離戰鬥。")
             battle_over = True
             escaped = True
         else:
             durability_loss = 1
             durability = max(0, durability - durability_loss)
-            messages.append("逃跑失敗，你耗費了體力。")
-            messages.append(f"耐久 {durability}/{max_durability}")
+            if verbose:
+                messages.append("逃跑失敗，你耗費了體力。")
+                messages.append(f"耐久 {durability}/{max_durability}")
 
     else:
         durability_loss = 1
         durability = max(0, durability - durability_loss)
-        messages.append("你猶豫不決，錯失時機。")
-        messages.append(f"耐久 {durability}/{max_durability}")
+        if verbose:
+            messages.append("你猶豫不決，錯失時機。")
+            messages.append(f"耐久 {durability}/{max_durability}")
 
     if not battle_over and durability <= 0:
         battle_over = True
         defeat = True
-        messages.append("你已經筋疲力竭，無法繼續戰鬥。")
+        if verbose:
+            messages.append("你已經筋疲力竭，無法繼續戰鬥。")
 
     if battle_over:
         # 戰鬥結束後重置耐久，離開戰鬥時顯示為滿值
         durability = max_durability
 
-    state["active"] = not battle_over
-    state["victory"] = victory
-    state["escaped"] = escaped
-    state["defeat"] = defeat
-    state["durability"] = durability
-    state["max_durability"] = max_durability
-    state["enemy"] = enemy
+    state.active = not battle_over
+    state.victory = victory
+    state.escaped = escaped
+    state.defeat = defeat
+    state.durability = durability
+    state.max_durability = max_durability
 
     return {
         "messages": messages,
@@ -185,7 +255,7 @@ def perform_battle_action(
         "defeat": defeat,
         "durability_loss": durability_loss,
         "remaining_durability": durability,
-        "turn_count": state["turn_count"],
+        "turn_count": state.turn_count,
         # Legacy keys kept for compatibility with callers.
         "player_damage": 0,
         "enemy_damage": 0,
@@ -11,10 +11,19 @@ decision if their fate value hovers too long within the neutral band.
 import copy
 import json
 import random
-from typing import Dict, List, Optional, Sequence, Tuple
+import sys
+from bisect import bisect
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 from paths import res_path
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # orjson is optional; stdlib json handles bytes too
+    orjson = None
+
 MIDBAND_MIN = 34
 MIDBAND_MAX = 66
 MIDBAND_LIMIT = 3
@@ -27,6 +36,12 @@ CHAPTER2_FIRST_EVENT_WITH_ROCK_ID = "村民盯著石頭"
 CHAPTER2_FIRST_EVENT_NO_ROCK_ID = "村民尋找失物"
 CHAPTER3_FIRST_EVENT_ID = "守衛傀儡戰"
 
+_rand = random.random
+
+DEFAULT_EVENT_TYPES = frozenset(
+    {"normal", "battle", "dialogue", "conditional", "milestone"}
+)
+
 CHAPTER_END_EVENTS = {
     1: ["第一章結束"],
     2: ["第二章結束"],
@@ -35,12 +50,44 @@ CHAPTER_END_EVENTS = {
 }
 
 
+_INTERNED_CONDITION_LISTS = ("inventory_has", "inventory_not", "flag_on", "flag_off")
+
+
+def _intern_condition(condition: Optional[Dict]) -> None:
+    if not condition:
+        return
+    for key in _INTERNED_CONDITION_LISTS:
+        values = condition.get(key)
+        if values:
+            condition[key] = [
+                sys.intern(value) if isinstance(value, str) else value
+                for value in values
+            ]
+
+
+def _intern_event_strings(event: Dict) -> None:
+    """Intern repeated identifier strings so equal values share one object.
+
+    JSON parsing allocates a fresh ``str`` for every value; interning ids,
+    types and condition entries lets set/dict probes hit the identity fast
+    path and drops the duplicates from memory.
+    """
+    for key in ("id", "type", "background"):
+        value = event.get(key)
+        if isinstance(value, str):
+            event[key] = sys.intern(value)
+    _intern_condition(event.get("condition"))
+    for option in event.get("options", []):
+        _intern_condition(option.get("condition"))
+
+
 # 載入所有事件資料
 def load_events(path: str = res_path("data", "story_data.json")):
-    with open(path, "r", encoding="utf-8") as f:
-        events = json.load(f)
+    data = Path(path).read_bytes()
+    events = orjson.loads(data) if orjson is not None else json.loads(data)
     for event in events:
         event.setdefault("background", DEFAULT_BACKGROUND)
+        _intern_event_strings(event)
     return events
 
 
@@ -49,6 +96,85 @@ ALL_EVENTS: List[Dict] = load_events()
 EVENT_LOOKUP: Dict[str, Dict] = {event["id"]: event for event in ALL_EVENTS}
 
 
+def _index_events_by_chapter(events: List[Dict]) -> Dict[Optional[int], List[Dict]]:
+    """Group events by their required chapter.
+
+    Chapter-less events appear in every bucket; the ``None`` bucket holds only
+    those and serves chapters no event targets.  Original ordering is kept so
+    weighted selection behaves exactly like a full scan of ``events``.
+    """
+    chapters = {event.get("chapter") for event in events} - {None}
+    index: Dict[Optional[int], List[Dict]] = {
+        chapter: [e for e in events if e.get("chapter") in (None, chapter)]
+        for chapter in chapters
+    }
+    index[None] = [e for e in events if e.get("chapter") is None]
+    return index
+
+
+EVENTS_BY_CHAPTER: Dict[Optional[int], List[Dict]] = _index_events_by_chapter(ALL_EVENTS)
+
+
+class ConditionContext(NamedTuple):
+    """Player fields read by compiled conditions, gathered once per lookup."""
+
+    fate: int
+    chapter: int
+    inventory: frozenset
+    flags: Dict
+
+
+Predicate = Callable[[ConditionContext], bool]
+
+
+@dataclass(frozen=True, slots=True)
+class EventEntry:
+    """Immutable view of the fields random selection reads per candidate."""
+
+    id: str
+    weight: int
+    predicate: Predicate
+    event: Dict
+
+
+CandidatePool = Tuple[List[EventEntry], List[EventEntry]]
+_CANDIDATE_POOLS: Dict[Tuple[int, frozenset], CandidatePool] = {}
+
+
+def _get_candidate_pool(chapter: int, event_types: frozenset) -> CandidatePool:
+    """Return the static random-event pool for a chapter and type filter.
+
+    Type, weight and chapter-end exclusions never change at runtime, so they
+    are resolved once per (chapter, types) pair.  The pool is split into
+    weighted entries eligible for selection and zero-weight entries that only
+    count towards "events remaining" in the chapter.
+    """
+    key = (chapter, event_types)
+    pool = _CANDIDATE_POOLS.get(key)
+    if pool is not None:
+        return pool
+
+    end_event_ids = set(CHAPTER_END_EVENTS.get(chapter, []))
+    weighted: List[EventEntry] = []
+    unweighted: List[EventEntry] = []
+    for event in EVENTS_BY_CHAPTER.get(chapter, EVENTS_BY_CHAPTER[None]):
+        if event.get("type") not in event_types:
+            continue
+        if event.get("id") in end_event_ids:
+            continue
+        event_id = event["id"]
+        entry = EventEntry(
+            id=event_id,
+            weight=int(event.get("weight", 1)),
+            predicate=EVENT_PREDICATES[event_id],
+            event=event,
+        )
+        (weighted if entry.weight > 0 else unweighted).append(entry)
+    pool = (weighted, unweighted)
+    _CANDIDATE_POOLS[key] = pool
+    return pool
+
+
 def _ensure_consumed_set(player) -> set:
     consumed = player.setdefault("consumed_events", set())
     if isinstance(consumed, list):
@@ -57,6 +183,30 @@ def _ensure_consumed_set(player) -> set:
     return consumed
 
 
+_inventory_snapshot: Tuple[Optional[Sequence[str]], List[str], frozenset] = (
+    None,
+    [],
+    frozenset(),
+)
+
+
+def _inventory_set(player) -> frozenset:
+    """Return the player's inventory as a frozenset, rebuilt only on change.
+
+    The cached snapshot is validated against the live list with a C-level
+    equality check, which is far cheaper than rebuilding the set for every
+    condition that inspects the inventory.
+    """
+    global _inventory_snapshot
+    inventory = player.get("inventory", [])
+    cached_source, cached_items, cached_set = _inventory_snapshot
+    if cached_source is inventory and cached_items == inventory:
+        return cached_set
+    items = list(inventory)
+    _inventory_snapshot = (inventory, items, frozenset(items))
+    return _inventory_snapshot[2]
+
+
 def _check_condition(condition: Dict, player) -> bool:
     if not condition:
         return True
@@ -75,12 +225,13 @@ def _check_condition(condition: Dict, player) -> bool:
     if "chapter_max" in condition and current_chapter > condition["chapter_max"]:
         return False
 
-    inventory: Sequence[str] = player.get("inventory", [])
-    for item in condition.get("inventory_has", []):
-        if item not in inventory:
+    inventory_has = condition.get("inventory_has")
+    inventory_not = condition.get("inventory_not")
+    if inventory_has or inventory_not:
+        inventory = _inventory_set(player)
+        if inventory_has and not inventory.issuperset(inventory_has):
             return False
-    for item in condition.get("inventory_not", []):
-        if item in inventory:
+        if inventory_not and not inventory.isdisjoint(inventory_not):
             return False
 
     flags = player.get("flags", {})
@@ -94,18 +245,92 @@ def _check_condition(condition: Dict, player) -> bool:
     return True
 
 
+def _condition_context(player) -> ConditionContext:
+    return ConditionContext(
+        fate=player.get("fate", 0),
+        chapter=player.get("chapter", 1),
+        inventory=_inventory_set(player),
+        flags=player.get("flags", {}),
+    )
+
+
+def _always_true(context: ConditionContext) -> bool:
+    return True
+
+
+def _compile_event_condition(event: Dict) -> Predicate:
+    """Turn an event's chapter and condition data into a single predicate.
+
+    Only the checks present in the data are emitted, so events without
+    conditions cost a single call at selection time.  The predicate reads a
+    ``ConditionContext`` so player lookups happen once per selection rather
+    than once per event.  Semantics mirror ``_check_condition`` exactly.
+    """
+    condition = event.get("condition") or {}
+    checks: List[Predicate] = []
+
+    required_chapter = event.get("chapter")
+    if required_chapter is not None:
+        checks.append(lambda c: c.chapter == required_chapter)
+
+    if "fate_min" in condition:
+        fate_min = condition["fate_min"]
+        checks.append(lambda c: c.fate >= fate_min)
+    if "fate_max" in condition:
+        fate_max = condition["fate_max"]
+        checks.append(lambda c: c.fate <= fate_max)
+
+    if "chapter_is" in condition:
+        chapter_is = condition["chapter_is"]
+        checks.append(lambda c: c.chapter == chapter_is)
+    if "chapter_min" in condition:
+        chapter_min = condition["chapter_min"]
+        checks.append(lambda c: c.chapter >= chapter_min)
+    if "chapter_max" in condition:
+        chapter_max = condition["chapter_max"]
+        checks.append(lambda c: c.chapter <= chapter_max)
+
+    inventory_has = frozenset(condition.get("inventory_has", []))
+    if inventory_has:
+        checks.append(lambda c: inventory_has <= c.inventory)
+    inventory_not = frozenset(condition.get("inventory_not", []))
+    if inventory_not:
+        checks.append(lambda c: inventory_not.isdisjoint(c.inventory))
+
+    flag_on = tuple(condition.get("flag_on", []))
+    if flag_on:
+        checks.append(lambda c: all(c.flags.get(f) for f in flag_on))
+    flag_off = tuple(condition.get("flag_off", []))
+    if flag_off:
+        checks.append(lambda c: not any(c.flags.get(f) for f in flag_off))
+
+    if not checks:
+        return _always_true
+    if len(checks) == 1:
+        return checks[0]
+    checks_tuple = tuple(checks)
+
+    def predicate(context: ConditionContext) -> bool:
+        for check in checks_tuple:
+            if not check(context):
+                return False
+        return True
+
+    return predicate
+
+
+# 事件條件於載入時預先編譯，避免每回合重新解讀條件字典
+EVENT_PREDICATES: Dict[str, Predicate] = {
+    event["id"]: _compile_event_condition(event) for event in ALL_EVENTS
+}
+
+
 def _tick_cooldowns(player) -> None:
-    cooldowns = player.setdefault("event_cooldowns", {})
-    to_remove: List[str] = []
-    for event_id, turns in list(cooldowns.items()):
-        if turns <= 0:
-            to_remove.append(event_id)
-            continue
-        cooldowns[event_id] = turns - 1
-        if cooldowns[event_id] <= 0:
-            to_remove.append(event_id)
-    for event_id in to_remove:
-        cooldowns.pop(event_id, None)
+    cooldowns = player.get("event_cooldowns") or {}
+    # 剩餘 1 回合以下的冷卻在本次遞減後即歸零，直接剔除
+    player["event_cooldowns"] = {
+        event_id: turns - 1 for event_id, turns in cooldowns.items() if turns > 1
+    }
 
 
 def _is_on_cooldown(event: Dict, player) -> bool:
@@ -114,11 +339,8 @@ def _is_on_cooldown(event: Dict, player) -> bool:
 
 
 def _was_consumed(event: Dict, player) -> bool:
-    consumed = player.get("consumed_events", set())
-    if isinstance(consumed, list):
-        consumed = set(consumed)
-        player["consumed_events"] = consumed
-    return event["id"] in consumed
+    # consumed_events 已於建立或讀檔時正規化為 set（見 player_state.migrate_player）
+    return event["id"] in player.get("consumed_events", ())
 
 
 def _apply_cooldown(event: Dict, player) -> None:
@@ -146,6 +368,10 @@ def is_event_condition_met(event: Dict, player) -> bool:
     if player is None:
         player = {}
 
+    predicate = EVENT_PREDICATES.get(event.get("id"))
+    if predicate is not None:
+        return predicate(_condition_context(player))
+
     required_chapter = event.get("chapter")
     if required_chapter is not None and player.get("chapter", 1) != required_chapter:
         return False
@@ -161,8 +387,7 @@ def get_event_by_id(event_id: str) -> Optional[Dict]:
     return EVENT_LOOKUP.get(event_id)
 
 
-def _get_fate_style(player) -> str:
-    fate = player.get("fate", 50)
+def _classify_fate_style(fate: int) -> str:
     if fate >= 67:
         return "absurd"
     if fate <= 33:
@@ -170,6 +395,16 @@ def _get_fate_style(player) -> str:
     return "neutral"
 
 
+_FATE_STYLES = tuple(_classify_fate_style(v) for v in range(101))
+
+
+def _get_fate_style(player) -> str:
+    fate = player.get("fate", 50)
+    if isinstance(fate, int) and 0 <= fate <= 100:
+        return _FATE_STYLES[fate]
+    return _classify_fate_style(fate)
+
+
 def _resolve_text_value(payload: Dict, style: str) -> Optional[str]:
     variants = payload.get("text_variants")
     if isinstance(variants, dict):
@@ -292,23 +527,21 @@ def get_random_event(event_types=None, player=None):
     built based on type, once/consumed status, cooldown and condition.
     """
     if event_types is None:
-        event_types = ["normal", "battle", "dialogue", "conditional", "milestone"]
+        event_types = DEFAULT_EVENT_TYPES
+    event_types = frozenset(event_types)
     if player is None:
         player = {}
 
     _tick_cooldowns(player)
 
-    # 確保任務簡報在其他遭遇前觸發
+    # 確保任務簡報在其他遭遇前觸發；開場序列走完後以旗標略過整段檢查
     if player is not None:
         player.setdefault("flags", {})
-        if player.get("chapter", 1) == 1:
-            intro_event = get_event_by_id(INTRO_EVENT_ID)
-            if (
-                intro_event
-                and not player["flags"].get("mission_briefed")
-                and not _was_consumed(intro_event, player)
-            ):
-                return _prepare_event(player, intro_event)
+        if not player.get("_past_intro") and player.get("chapter", 1) == 1:
+            if not player["flags"].get("mission_briefed"):
+                intro_event = get_event_by_id(INTRO_EVENT_ID)
+                if intro_event and not _was_consumed(intro_event, player):
+                    return _prepare_event(player, intro_event)
             # 遊戲開局固定順序：荒野拾石 -> 遭遇野豬 -> 其他事件
             first_wild = get_event_by_id(FIRST_WILD_EVENT_ID)
             if first_wild and not _was_consumed(first_wild, player):
@@ -316,6 +549,7 @@ def get_random_event(event_types=None, player=None):
             first_battle = get_event_by_id(FIRST_BATTLE_EVENT_ID)
             if first_battle and not _was_consumed(first_battle, player):
                 return _prepare_event(player, first_battle)
+            player["_past_intro"] = True
 
     start_event = _get_chapter_start_event(player)
     if start_event:
@@ -337,39 +571,50 @@ def get_random_event(event_types=None, player=None):
                 f"[event_manager] 找不到強制事件 {forced_event_id}，改以一般事件取代。"
             )
 
-    streak = _increment_midband_counter(player)
-    if streak >= MIDBAND_LIMIT:
-        trigger_event = get_event_by_id(FATE_TRIGGER_MIDBAND_ID)
-        if (
-            trigger_event
-            and not _was_consumed(trigger_event, player)
-            and is_event_condition_met(trigger_event, player)
-        ):
-            player["midband_counter"] = 0
-            return _prepare_event(player, trigger_event)
-
-    end_event_ids = set(CHAPTER_END_EVENTS.get(player.get("chapter", 1), []))
-
-    remaining_events: List[Dict] = []
-    candidates: List[Tuple[Dict, int]] = []
-    for event in ALL_EVENTS:
-        if event.get("type") not in event_types:
-            continue
-        if event.get("id") in end_event_ids:
-            continue
-        if _was_consumed(event, player):
-            continue
-        if not is_event_condition_met(event, player):
+    if MIDBAND_MIN <= player.get("fate", 50) <= MIDBAND_MAX:
+        streak = _increment_midband_counter(player)
+        if streak >= MIDBAND_LIMIT:
+            trigger_event = get_event_by_id(FATE_TRIGGER_MIDBAND_ID)
+            if (
+                trigger_event
+                and not _was_consumed(trigger_event, player)
+                and is_event_condition_met(trigger_event, player)
+            ):
+                player["midband_counter"] = 0
+                return _prepare_event(player, trigger_event)
+    elif player.get("midband_counter"):
+        player["midband_counter"] = 0
+
+    chapter = player.get("chapter", 1)
+    weighted_pool, unweighted_pool = _get_candidate_pool(chapter, event_types)
+
+    consumed = player.get("consumed_events", ())
+    cooldowns = player.get("event_cooldowns", {})
+    context = _condition_context(player)
+    has_remaining = False
+    candidates: List[Dict] = []
+    cum_weights: List[int] = []
+    total_weight = 0
+    for entry in weighted_pool:
+        if entry.id in consumed:
             continue
-        remaining_events.append(event)
-        if _is_on_cooldown(event, player):
+        if not entry.predicate(context):
             continue
-        weight = int(event.get("weight", 1))
-        if weight <= 0:
+        has_remaining = True
+        if cooldowns.get(entry.id, 0) > 0:
             continue
-        candidates.append((event, weight))
+        total_weight += entry.weight
+        candidates.append(entry.event)
+        cum_weights.append(total_weight)
+
+    if not has_remaining:
+        # 權重為 0 的事件不會被抽中，但仍算作本章尚未完成的事件
+        has_remaining = any(
+            entry.id not in consumed and entry.predicate(context)
+            for entry in unweighted_pool
+        )
 
-    if not remaining_events:
+    if not has_remaining:
         end_event = _pick_chapter_end_event(player, event_types)
         if end_event:
             return _prepare_event(player, end_event)
@@ -377,6 +622,7 @@ def get_random_event(event_types=None, player=None):
     if not candidates:
         return None
 
-    events, weights = zip(*candidates)
-    chosen = random.choices(events, weights=weights, k=1)[0]
+    # 與 random.choices 相同的累積權重抽樣，但省去 zip 與重建權重表
+    index = bisect(cum_weights, _rand() * total_weight, 0, len(cum_weights) - 1)
+    chosen = candidates[index]
     return _prepare_event(player, chosen)
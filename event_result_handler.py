@@ -9,52 +9,138 @@ to branch immediately.
 """
 
 import text_log
-from typing import Dict, Any, Optional
+from functools import partial
+from typing import Dict, Any, List, Optional
 
 from battle_system import perform_battle_action
 import sound_manager
 
 MISSION_BRIEF_FLAG = "mission_briefed"
+# 只含敘述與數值效果的結果可走捷徑，略過戰鬥、背包、旗標等流程
+_SIMPLE_RESULT_KEYS = frozenset({"text", "effect"})
+# 數值變化訊息模板：格式只解析一次
+_STAT_FMT = "【數值變化】{0} {1} {2}{3} → {4}".format
 
 from fate_system import (
     FateChange,
     apply_fate_change,
     apply_major_choice,
     apply_normal_choice,
+    fate_batch,
 )
 
 
 def _apply_numeric_change(player: Dict, key: str, value: int) -> None:
-    """Apply a numeric change to the given player stat with logging."""
+    """Apply a numeric change to the given player stat, clamped at zero."""
 
-    if key not in player:
+    try:
+        old_value = player[key]
+    except KeyError:
         return
 
-    old_value = player[key]
-    player[key] += value
+    new_value = old_value + value
+    if new_value < 0:
+        new_value = 0
+    player[key] = new_value
+    # 終端輸出僅供除錯，跟隨開發者日誌開關
+    if text_log.is_dev_log_enabled():
+        print(_STAT_FMT(key.upper(), old_value, "+" if value >= 0 else "", value, new_value))
 
-    if player[key] < 0:
-        player[key] = 0
-    print(
-        f"【數值變化】{key.upper()} {old_value} {'+' if value >= 0 else ''}{value} → {player[key]}"
+
+def _apply_fate_effect(player: Dict, value: int, source_text: str | None) -> None:
+    apply_normal_choice(player, value, source_text or "命運波動")
+
+
+def _apply_fate_major_effect(player: Dict, value: int, source_text: str | None) -> None:
+    apply_major_choice(player, value, source_text or "重大抉擇")
+
+
+def _apply_fate_bias_effect(player: Dict, value: int, source_text: str | None) -> None:
+    apply_fate_change(player, FateChange(value, source_text or "命運微調", "bias"))
+
+
+# 特殊效果鍵的處理函式；其餘鍵一律視為數值屬性變化
+_EFFECT_HANDLERS = {
+    "fate": _apply_fate_effect,
+    "fate_major": _apply_fate_major_effect,
+    "fate_bias": _apply_fate_bias_effect,
+}
+
+
+def _apply_effects(player: Dict, effects: Optional[Dict], source_text: str | None) -> None:
+    if not effects:
+        return
+    get_handler = _EFFECT_HANDLERS.get
+    for key, value in effects.items():
+        handler = get_handler(key)
+        if handler is not None:
+            handler(player, value, source_text)
+        else:
+            _apply_numeric_change(player, key, value)
+
+
+def _gain_item(inventory: List[str], item_name: str) -> None:
+    """on_show callback: add the item once its log line appears."""
+    if item_name not in inventory:
+        inventory.append(item_name)
+        sound_manager.play_sfx("pickup")
+
+
+def _lose_item(inventory: List[str], item_name: str) -> None:
+    """on_show callback: remove the item once its log line appears."""
+    # 單次掃描：直接 remove，不存在時略過
+    try:
+        inventory.remove(item_name)
+    except ValueError:
+        return
+    sound_manager.play_sfx("pickup")
+
+
+def _log_entries(entries, category: str = "narration") -> None:
+    """Log a single entry or a list of entries.
+
+    Entries may be plain strings or ``{"text": ..., "category": ...}`` dicts;
+    dict entries without text are skipped.
+    """
+    if not isinstance(entries, (list, tuple)):
+        entries = (entries,)
+    elif not any(isinstance(entry, dict) for entry in entries):
+        text_log.add_many(entries, category=category)
+        return
+    add_log = text_log.add
+    for entry in entries:
+        if isinstance(entry, dict):
+            text = entry.get("text")
+            if text:
+                add_log(str(text), category=entry.get("category", category))
+        else:
+            add_log(entry, category=category)
+
+
+def _start_ending(player: Dict, ending_segments: List[str]) -> None:
+    """Reset the ending playback state to show ``ending_segments`` from the top."""
+    player.update(
+        ending_segments=ending_segments,
+        ending_segment_index=1,
+        ending_active=True,
+        ending_exit_ready=False,
+        ending_exit_started=False,
     )
 
 
-def _apply_effects(player: Dict, effects: Dict, source_text: str | None) -> None:
-    for key, value in (effects or {}).items():
-        if key == "fate":
-            apply_normal_choice(player, value, source_text or "命運波動")
-            continue
-        if key == "fate_major":
-            apply_major_choice(player, value, source_text or "重大抉擇")
-            continue
-        if key == "fate_bias":
-            apply_fate_change(
-                player,
-                FateChange(value, source_text or "命運微調", "bias"),
-            )
-            continue
-        _apply_numeric_change(player, key, value)
+def _handle_simple_result(player: Dict, result: Dict) -> None:
+    """Fast path for results carrying only ``text`` and/or ``effect``."""
+    primary_text = result.get("text")
+    if primary_text:
+        if text_log.is_dev_log_enabled():
+            print("【事件結果】", primary_text)
+        text_log.add(primary_text)
+    effect = result.get("effect")
+    if effect:
+        # 與一般路徑相同，同一結果內的命運變化合併成一筆紀錄
+        with fate_batch():
+            _apply_effects(player, effect, primary_text or "事件效果")
+    return None
 
 
 def handle_event_result(player: Dict, result: Dict) -> str | None:
@@ -79,161 +165,139 @@ def handle_event_result(player: Dict, result: Dict) -> str | None:
 
     The return value is a forced event ID if one should be queued.
     """
-    ending_segments = result.get("ending_segments")
+    if result.keys() <= _SIMPLE_RESULT_KEYS:
+        return _handle_simple_result(player, result)
+
+    rget = result.get
+    add_log = text_log.add
+    ending_segments = rget("ending_segments")
+    primary_text = rget("text")
+    end_game = rget("end_game")
+    forced_event = rget("forced_event")
+    battle_action = rget("battle_action")
+    emit_log = rget("emit_log")
+    effect = rget("effect")
+    inventory_add = rget("inventory_add")
+    inventory_remove = rget("inventory_remove")
+    flags_set = rget("flags_set")
+    flags_clear = rget("flags_clear")
+    goto_chapter = rget("goto_chapter")
+    flags = player.setdefault("flags", {})
+    inventory = player.setdefault("inventory", [])
+
     if ending_segments and not isinstance(ending_segments, list):
         ending_segments = [str(ending_segments)]
 
-    primary_text = result.get("text")
-    if result.get("end_game") and not ending_segments and primary_text:
+    if end_game and not ending_segments and primary_text:
         ending_segments = [segment for segment in primary_text.split("\n\n") if segment]
 
     if ending_segments:
-        text_log.clear_history()
-        player["ending_segments"] = ending_segments
-        player["ending_segment_index"] = 1
-        player["ending_active"] = True
-        player["ending_exit_ready"] = False
-        player["ending_exit_started"] = False
-        primary_text = ending_segments[0] if ending_segments else None
+        text_log.clear_history_if_dirty()
+        _start_ending(player, ending_segments)
+        primary_text = ending_segments[0]
 
     if primary_text:
-        print("【事件結果】", primary_text)
-        text_log.add(primary_text)
-
-    forced_event = result.get("forced_event")
-
-    def _emit_log_entry(entry, *, default_category: str = "system") -> None:
-        if isinstance(entry, dict):
-            text = entry.get("text")
-            if not text:
-                return
-            category = entry.get("category", default_category)
-            text_log.add(str(text), category=category)
-            return
-        text_log.add(entry, category=default_category)
-
-    # 戰鬥專用處理
-    battle_action = result.get("battle_action")
-    battle_outcome: Optional[Dict[str, Any]] = None
-    if battle_action:
-        battle_outcome = perform_battle_action(player, battle_action, result)
-        for message in battle_outcome.get("messages", []):
-            text_log.add(message, category="system")
-
-        # 允許戰鬥行動指定後續的強制事件
-        if battle_outcome.get("battle_over") and result.get("forced_event_on_end"):
-            forced_event = forced_event or result.get("forced_event_on_end")
-        if (
-            battle_outcome.get("battle_over")
-            and (not battle_outcome.get("victory"))
-            and (not battle_outcome.get("escaped"))
-        ):
-            forced_event = forced_event or result.get("forced_event_on_defeat")
-
-        if battle_outcome.get("battle_over"):
-            if battle_outcome.get("victory"):
-                _apply_effects(
-                    player,
-                    result.get("victory_effect") or {},
-                    result.get("victory_text") or primary_text or "勝利獎勵",
-                )
-                victory_log = result.get("victory_log")
-                if victory_log:
-                    if isinstance(victory_log, list):
-                        for entry in victory_log:
-                            _emit_log_entry(entry, default_category="system")
-                    else:
-                        _emit_log_entry(victory_log, default_category="system")
-            elif battle_outcome.get("escaped"):
-                _apply_effects(
-                    player,
-                    result.get("escape_effect") or {},
-                    result.get("escape_text") or primary_text or "撤退",
-                )
-            else:
-                _apply_effects(
-                    player,
-                    result.get("defeat_effect") or {},
-                    result.get("defeat_text") or primary_text or "戰鬥失敗",
-                )
-                defeat_log = result.get("defeat_log")
-                if defeat_log:
-                    if isinstance(defeat_log, list):
-                        for entry in defeat_log:
-                            text_log.add(entry, category="system")
-                    else:
-                        text_log.add(defeat_log, category="system")
-
-    # 若有指定則額外寫入日誌
-    if "emit_log" in result:
-        log_entry = result["emit_log"]
-        if isinstance(log_entry, list):
-            for entry in log_entry:
-                text_log.add(entry)
-        else:
-            text_log.add(log_entry)
-
-    if result.get("end_game"):
-        player.setdefault("flags", {})["ending_cinematic"] = True
-        player["layout_transition"] = {"progress": 0.0}
-        text_log.set_typewriter_override(True)
-        player["ending_active"] = True
-
-    # 套用數值屬性變化
-    effect = result.get("effect") or {}
-    if effect:
-        _apply_effects(player, effect, primary_text or "事件效果")
+        if text_log.is_dev_log_enabled():
+            print("【事件結果】", primary_text)
+        add_log(primary_text)
+
+    # 同一事件內的命運變化合併成一筆紀錄
+    with fate_batch():
+        # 戰鬥專用處理
+        battle_outcome: Optional[Dict[str, Any]] = None
+        if battle_action:
+            battle_outcome = perform_battle_action(player, battle_action, result)
+            text_log.add_many(battle_outcome.get("messages", ()), category="system")
+
+            # 允許戰鬥行動指定後續的強制事件
+            if battle_outcome.get("battle_over") and rget("forced_event_on_end"):
+                forced_event = forced_event or rget("forced_event_on_end")
+            if (
+                battle_outcome.get("battle_over")
+                and (not battle_outcome.get("victory"))
+                and (not battle_outcome.get("escaped"))
+            ):
+                forced_event = forced_event or rget("forced_event_on_defeat")
+
+            if battle_outcome.get("battle_over"):
+                if battle_outcome.get("victory"):
+                    _apply_effects(
+                        player,
+                        rget("victory_effect"),
+                        rget("victory_text") or primary_text or "勝利獎勵",
+                    )
+                    victory_log = rget("victory_log")
+                    if victory_log:
+                        _log_entries(victory_log, category="system")
+                elif battle_outcome.get("escaped"):
+                    _apply_effects(
+                        player,
+                        rget("escape_effect"),
+                        rget("escape_text") or primary_text or "撤退",
+                    )
+                else:
+                    _apply_effects(
+                        player,
+                        rget("defeat_effect"),
+                        rget("defeat_text") or primary_text or "戰鬥失敗",
+                    )
+                    defeat_log = rget("defeat_log")
+                    if defeat_log:
+                        _log_entries(defeat_log, category="system")
+
+        # 若有指定則額外寫入日誌
+        if emit_log is not None:
+            _log_entries(emit_log)
+
+        if end_game:
+            flags["ending_cinematic"] = True
+            player.update(layout_transition={"progress": 0.0}, ending_active=True)
+            text_log.set_typewriter_override(True)
+
+        # 套用數值屬性變化
+        if effect:
+            _apply_effects(player, effect, primary_text or "事件效果")
 
     # 背包異動：在橘色提示出現時同步音效與背包更新
-    inventory = player.setdefault("inventory", [])
-    if "inventory_add" in result:
-        items = result["inventory_add"]
+    if inventory_add:
+        items = inventory_add
         if not isinstance(items, list):
-            items = [items]
+            items = (items,)
         for item in items:
-            def _apply_gain(item_name=item):
-                if item_name not in player["inventory"]:
-                    player["inventory"].append(item_name)
-                    sound_manager.play_sfx("pickup")
-
-            text_log.add(
+            add_log(
                 f"你獲得了道具:{item}",
                 category="system",
-                on_show=_apply_gain,
+                on_show=partial(_gain_item, inventory, item),
             )
 
-    if "inventory_remove" in result:
-        items = result["inventory_remove"]
+    if inventory_remove:
+        items = inventory_remove
         if not isinstance(items, list):
-            items = [items]
+            items = (items,)
         for item in items:
-            def _apply_loss(item_name=item):
-                if item_name in player["inventory"]:
-                    player["inventory"].remove(item_name)
-                    sound_manager.play_sfx("pickup")
-
-            text_log.add(
+            add_log(
                 f"你失去了道具:{item}",
                 category="system",
-                on_show=_apply_loss,
+                on_show=partial(_lose_item, inventory, item),
             )
 
     # 旗標管理
-    for flag in result.get("flags_set", []) or []:
-        player.setdefault("flags", {})[flag] = True
-        text_log.add(f"旗標觸發：{flag}", category="dev")
-        if flag == MISSION_BRIEF_FLAG:
-            text_log.add("任務已建立：調查淺川村", category="system")
-    for flag in result.get("flags_clear", []) or []:
-        if player.setdefault("flags", {}).get(flag):
-            player["flags"][flag] = False
-            text_log.add(f"旗標解除：{flag}", category="dev")
+    if flags_set:
+        for flag in flags_set:
+            flags[flag] = True
+            add_log(f"旗標觸發：{flag}", category="dev")
+            if flag == MISSION_BRIEF_FLAG:
+                add_log("任務已建立：調查淺川村", category="system")
+    if flags_clear:
+        for flag in flags_clear:
+            if flags.get(flag):
+                flags[flag] = False
+                add_log(f"旗標解除：{flag}", category="dev")
 
     # 跳轉章節
-    goto_chapter = result.get("goto_chapter")
     if goto_chapter:
         player["chapter"] = goto_chapter
-        text_log.add(f"章節推進至：第 {goto_chapter} 章", category="system")
+        add_log(f"章節推進至：第 {goto_chapter} 章", category="system")
 
     return forced_event
 
@@ -6,8 +6,9 @@ helper functions for adjusting fate during story events.
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import text_log
 
@@ -18,8 +19,11 @@ MAX_NORMAL_DELTA = 10
 MAX_MAJOR_DELTA = 20
 MAX_BIAS_DELTA = 5
 
+# fate_batch() 期間暫存的 (舊值, 新值)；None 表示未在批次中
+_pending_fate_log: Optional[List[Tuple[int, int]]] = None
 
-@dataclass
+
+@dataclass(slots=True)
 class FateChange:
     value: int
     reason: str
@@ -31,16 +35,24 @@ def clamp(value: int, minimum: int = FATE_MIN, maximum: int = FATE_MAX) -> int:
     return max(minimum, min(maximum, value))
 
 
+_DELTA_LIMITS = {
+    "normal": (-MAX_NORMAL_DELTA, MAX_NORMAL_DELTA),
+    "major": (-MAX_MAJOR_DELTA, MAX_MAJOR_DELTA),
+    "bias": (-MAX_BIAS_DELTA, MAX_BIAS_DELTA),
+}
+_DEFAULT_DELTA_LIMIT = _DELTA_LIMITS["normal"]
+
+
 def _limit_delta(delta: int, kind: str) -> int:
-    limit = {
-        "normal": MAX_NORMAL_DELTA,
-        "major": MAX_MAJOR_DELTA,
-        "bias": MAX_BIAS_DELTA,
-    }.get(kind, MAX_NORMAL_DELTA)
-    return max(-limit, min(limit, delta))
+    low, high = _DELTA_LIMITS.get(kind, _DEFAULT_DELTA_LIMIT)
+    if delta > high:
+        return high
+    if delta < low:
+        return low
+    return delta
 
 
-def _get_fate_label(value: int) -> str:
+def _classify_fate(value: int) -> str:
     if value >= 67:
         return "荒謬"
     if value <= 33:
@@ -48,10 +60,24 @@ def _get_fate_label(value: int) -> str:
     return "正常"
 
 
+# 命運值已被 clamp 在 [FATE_MIN, FATE_MAX]，可直接查表
+_FATE_LABELS = tuple(_classify_fate(v) for v in range(FATE_MIN, FATE_MAX + 1))
+
+
+def _get_fate_label(value: int) -> str:
+    if isinstance(value, int) and FATE_MIN <= value <= FATE_MAX:
+        return _FATE_LABELS[value - FATE_MIN]
+    return _classify_fate(value)
+
+
 def apply_fate_change(player: Dict, change: FateChange) -> None:
     """Apply a fate delta while respecting narrative limits."""
-    limited_delta = _limit_delta(change.value, change.kind)
-    if limited_delta != change.value:
+    _apply_fate_delta(player, change.value, change.kind)
+
+
+def _apply_fate_delta(player: Dict, delta: int, kind: str) -> None:
+    limited_delta = _limit_delta(delta, kind)
+    if limited_delta != delta:
         text_log.add("命運增減被系統限制住了。", category="system")
     if limited_delta == 0:
         return
@@ -60,18 +86,43 @@ def apply_fate_change(player: Dict, change: FateChange) -> None:
     new_value = clamp(old_value + limited_delta)
     player["fate"] = new_value
 
+    if _pending_fate_log is not None:
+        _pending_fate_log.append((old_value, new_value))
+        return
+    _log_fate_transition(old_value, new_value)
+
+
+def _log_fate_transition(old_value: int, new_value: int) -> None:
     fate_label = _get_fate_label(new_value)
     text_log.add(f"命運值 {old_value} → {new_value}（{fate_label}）", category="dev")
 
 
+@contextmanager
+def fate_batch() -> Iterator[None]:
+    """Coalesce fate changes made inside the block into one log entry."""
+    global _pending_fate_log
+    if _pending_fate_log is not None:
+        # 已在外層批次中，由外層負責輸出
+        yield
+        return
+    _pending_fate_log = []
+    try:
+        yield
+    finally:
+        pending, _pending_fate_log = _pending_fate_log, None
+        if pending:
+            _log_fate_transition(pending[0][0], pending[-1][1])
+
+
 def post_event_update(player: Dict) -> Optional[str]:
     """Update progression after each event."""
     return None
 
 
+# reason 目前只用於呼叫端的敘述，直接套用數值即可，不必建立 FateChange
 def apply_major_choice(player: Dict, delta: int, reason: str) -> None:
-    apply_fate_change(player, FateChange(delta, reason, "major"))
+    _apply_fate_delta(player, delta, "major")
 
 
 def apply_normal_choice(player: Dict, delta: int, reason: str) -> None:
-    apply_fate_change(player, FateChange(delta, reason, "normal"))
+    _apply_fate_delta(player, delta, "normal")
@@ -9,6 +9,8 @@ import pygame
 import sys
 import text_log
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Optional
 
 from pathlib import Path
@@ -25,6 +27,7 @@ BGM_CHAPTER_TRACKS = {
 BGM_CHAPTER_3_TRACK = "Music-3.mp3"
 BGM_CHAPTER_45_TRACK = "Music-45.mp3"
 ENDING_EXIT_DELAY_MS = 2000
+SAVE_MIN_INTERVAL_MS = 500
 ENDING_FADE_SPEED = 160.0
 ENDING_LAYOUT_TRANSITION_SEC = 0.6
 INTRO_FADE_SPEED = 260.0
@@ -81,19 +84,33 @@ from fate_system import post_event_update
 from battle_system import start_battle, is_battle_active, clear_battle_state
 
 
+# 動畫狀態；攻擊相關狀態連續排在最後，可用 >= ANIM_ATTACK_APPROACH 判斷
+ANIM_IDLE = 0
+ANIM_WALKING = 1
+ANIM_ATTACK_APPROACH = 2
+ANIM_ATTACKING = 3
+ANIM_ATTACK_RETURN = 4
+
+# 圖像區域為固定版面（UI_AREAS 不隨視窗縮放改變），動畫計算直接使用其邊界
+_IMAGE_LEFT = UI_AREAS["image"].x
+_IMAGE_RIGHT = UI_AREAS["image"].right
+_IMAGE_BOTTOM = UI_AREAS["image"].bottom
+
+# 玩家動畫節奏（秒），所有 PlayerAnimator 共用
+PLAYER_IDLE_FRAME_TIME = 0.35
+PLAYER_WALK_FRAME_TIME = 0.1
+PLAYER_ATTACK_FRAME_TIME = 0.07
+PLAYER_WALK_DURATION = 1.2
+PLAYER_ATTACK_APPROACH_DURATION = 0.35
+PLAYER_ATTACK_RETURN_DURATION = 0.3
+PLAYER_FADE_DURATION = 0.45
+
+
 # 簡易的玩家動畫控制器
 class PlayerAnimator:
     def __init__(self, target_height: int = 96):
         self.target_height = target_height
-        self.idle_frames = self._load_idle_frames()
-        self.walk_frames = self._load_walk_frames()
-        self.attack_frames = self._load_attack_frames()
-        self.idle_frame_time = 0.35
-        self.walk_frame_time = 0.1
-        self.attack_frame_time = 0.07
-        self.walk_duration = 1.2
-        self.attack_approach_duration = 0.35
-        self.attack_return_duration = 0.3
+        self._load_frames()
         self.attack_target_x = 0.0
         self.attack_start_x = 0.0
         self.attack_return_start_x = 0.0
@@ -101,31 +118,30 @@ class PlayerAnimator:
         self.attack_sfx_played = False
         self.frame_index = 0
         self.frame_timer = 0.0
-        self.state = "idle"
+        self.state = ANIM_IDLE
         self.walk_progress = 0.0
         self.walk_finished = False
         self.attack_finished = True
         self.fade_state: Optional[str] = None
         self.fade_timer = 0.0
-        self.fade_duration = 0.45
         self.fade_alpha = 0
-        self.walk_start_x = UI_AREAS["image"].x + 16
-        self.idle_x = UI_AREAS["image"].x + 32
-        self.base_y = UI_AREAS["image"].bottom - self.target_height - 16
+        self.walk_start_x = _IMAGE_LEFT + 16
+        self.idle_x = _IMAGE_LEFT + 32
+        self.base_y = _IMAGE_BOTTOM - self.target_height - 16
         first_walk_frame = self.walk_frames[0] if self.walk_frames else None
         walk_width = (
             first_walk_frame.get_width() if first_walk_frame else self.target_height
         )
         self.walk_end_x = max(
             self.walk_start_x,
-            UI_AREAS["image"].right - walk_width - 16,
+            _IMAGE_RIGHT - walk_width - 16,
         )
         self.position = [self.idle_x, self.base_y]
 
     def _scale_to_height(self, surface: pygame.Surface) -> pygame.Surface:
         width = surface.get_width()
         height = surface.get_height()
-        if height == 0:
+        if height == 0 or height == self.target_height:
             return surface
         ratio = self.target_height / height
         scaled = pygame.transform.smoothscale(
@@ -136,46 +152,51 @@ class PlayerAnimator:
     def _slice_sheet(self, sheet: pygame.Surface, columns: int, rows: int):
         frame_w = sheet.get_width() // columns
         frame_h = sheet.get_height() // rows
-        frames: list[pygame.Surface] = []
-        for row in range(rows):
-            for col in range(columns):
-                frame_rect = pygame.Rect(col * frame_w, row * frame_h, frame_w, frame_h)
-                frame_surface = pygame.Surface((frame_w, frame_h), pygame.SRCALPHA)
-                frame_surface.blit(sheet, (0, 0), frame_rect)
-                frames.append(self._scale_to_height(frame_surface))
-        return frames
-
-    def _load_idle_frames(self) -> list[pygame.Surface]:
-        idle_sheet = pygame.image.load(
-            res_path("assets", "images", "player", "idle", "idle.png")
-        ).convert_alpha()
+        # 子區域是共用 sheet 像素的視圖（會保留對 sheet 的參照），縮放時才產生新 surface
+        return [
+            self._scale_to_height(
+                sheet.subsurface((col * frame_w, row * frame_h, frame_w, frame_h))
+            )
+            for row in range(rows)
+            for col in range(columns)
+        ]
+
+    def _load_frames(self) -> None:
+        idle_path = res_path("assets", "images", "player", "idle", "idle.png")
+        walk_paths = [
+            res_path("assets", "images", "player", "walk", f"walk{i}.png")
+            for i in range(1, 7)
+        ]
+        attack_paths = [
+            res_path("assets", "images", "player", "attack", f"{i}.png")
+            for i in range(1, 10)
+        ]
+        # 讀檔與 PNG 解碼交給背景執行緒同時進行；convert_alpha 與縮放需留在主執行緒
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            idle_future = executor.submit(pygame.image.load, idle_path)
+            walk_images = executor.map(pygame.image.load, walk_paths)
+            attack_images = executor.map(pygame.image.load, attack_paths)
+            idle_sheet = idle_future.result()
+            walk_images = list(walk_images)
+            attack_images = list(attack_images)
+
         # idle 圖只有兩格，直接左右切成 2 張
-        return self._slice_sheet(idle_sheet, columns=2, rows=1)
-
-    def _load_walk_frames(self) -> list[pygame.Surface]:
-        frames: list[pygame.Surface] = []
-        for i in range(1, 7):
-            frame = pygame.image.load(
-                res_path("assets", "images", "player", "walk", f"walk{i}.png")
-            ).convert_alpha()
-            frames.append(self._scale_to_height(frame))
-        return frames
-
-    def _load_attack_frames(self) -> list[pygame.Surface]:
-        frames: list[pygame.Surface] = []
-        for i in range(1, 10):
-            frame = pygame.image.load(
-                res_path("assets", "images", "player", "attack", f"{i}.png")
-            ).convert_alpha()
-            frames.append(self._scale_to_height(frame))
-        return frames
+        self.idle_frames = self._slice_sheet(
+            idle_sheet.convert_alpha(), columns=2, rows=1
+        )
+        self.walk_frames = [
+            self._scale_to_height(image.convert_alpha()) for image in walk_images
+        ]
+        self.attack_frames = [
+            self._scale_to_height(image.convert_alpha()) for image in attack_images
+        ]
 
     def start_walk(self):
         if not self.walk_frames:
             self.walk_finished = True
-            self.state = "idle"
+            self.state = ANIM_IDLE
             return
-        self.state = "walking"
+        self.state = ANIM_WALKING
         self.walk_progress = 0.0
         self.frame_index = 0
         self.frame_timer = 0.0
@@ -185,7 +206,7 @@ class PlayerAnimator:
         self.position[0] = self.walk_start_x
 
     def start_transition_fade(self):
-        self.state = "idle"
+        self.state = ANIM_IDLE
         self.walk_progress = 0.0
         self.frame_index = 0
         self.frame_timer = 0.0
@@ -209,11 +230,11 @@ class PlayerAnimator:
         if enemy_position:
             enemy_x = float(enemy_position[0])
         else:
-            enemy_x = UI_AREAS["image"].right - enemy_w - 32
+            enemy_x = _IMAGE_RIGHT - enemy_w - 32
         target_x = enemy_x - frames_width + self.attack_gap
-        min_x = UI_AREAS["image"].x + 8
+        min_x = _IMAGE_LEFT + 8
         self.attack_target_x = max(min_x, target_x)
-        self.state = "attack_approach"
+        self.state = ANIM_ATTACK_APPROACH
         self.walk_progress = 0.0
         self.frame_index = 0
         self.frame_timer = 0.0
@@ -226,10 +247,10 @@ class PlayerAnimator:
         self.attack_sfx_played = False
 
     def update(self, dt: float):
-        self.walk_finished = False
-        self.attack_finished = False
+        if dt <= 0.0:
+            return
 
-        if self.state in ("attack_approach", "attacking", "attack_return"):
+        if self.state >= ANIM_ATTACK_APPROACH:
             self._update_attack(dt)
             return
 
@@ -237,9 +258,11 @@ class PlayerAnimator:
         if self.fade_state:
             return
 
-        frames = self.walk_frames if self.state == "walking" else self.idle_frames
+        frames = self.walk_frames if self.state == ANIM_WALKING else self.idle_frames
         frame_time = (
-            self.walk_frame_time if self.state == "walking" else self.idle_frame_time
+            PLAYER_WALK_FRAME_TIME
+            if self.state == ANIM_WALKING
+            else PLAYER_IDLE_FRAME_TIME
         )
 
         self.frame_timer += dt
@@ -247,12 +270,12 @@ class PlayerAnimator:
             self.frame_timer %= frame_time
             self.frame_index = (self.frame_index + 1) % len(frames)
 
-        if self.state == "walking":
-            if self.walk_duration <= 0:
+        if self.state == ANIM_WALKING:
+            if PLAYER_WALK_DURATION <= 0:
                 self.position[0] = self.walk_end_x
                 self._start_fade_out()
             else:
-                self.walk_progress += dt / self.walk_duration
+                self.walk_progress += dt / PLAYER_WALK_DURATION
                 self.walk_progress = min(self.walk_progress, 1.0)
                 delta_x = self.walk_end_x - self.walk_start_x
                 self.position[0] = self.walk_start_x + delta_x * self.walk_progress
@@ -262,9 +285,9 @@ class PlayerAnimator:
             self.position[0] = self.idle_x
 
     def current_frame(self) -> Optional[pygame.Surface]:
-        if self.state == "attacking":
+        if self.state == ANIM_ATTACKING:
             frames = self.attack_frames
-        elif self.state in ("attack_approach", "attack_return", "walking"):
+        elif self.state != ANIM_IDLE:
             frames = self.walk_frames
         else:
             frames = self.idle_frames
@@ -286,7 +309,7 @@ class PlayerAnimator:
             return
 
         self.fade_timer += dt
-        progress = min(self.fade_timer / self.fade_duration, 1.0)
+        progress = min(self.fade_timer / PLAYER_FADE_DURATION, 1.0)
 
         if self.fade_state == "out":
             self.fade_alpha = int(255 * progress)
@@ -294,7 +317,7 @@ class PlayerAnimator:
                 self.fade_state = "in"
                 self.fade_timer = 0.0
                 self.fade_alpha = 255
-                self.state = "idle"
+                self.state = ANIM_IDLE
                 self.walk_progress = 0.0
                 self.frame_index = 0
                 self.frame_timer = 0.0
@@ -307,51 +330,51 @@ class PlayerAnimator:
                 self.walk_finished = True
 
     def _update_attack(self, dt: float):
-        if self.state == "attack_approach":
-            self._advance_frames(self.walk_frames, self.walk_frame_time, dt)
-            duration = max(0.01, self.attack_approach_duration)
+        if self.state == ANIM_ATTACK_APPROACH:
+            self._advance_frames(self.walk_frames, PLAYER_WALK_FRAME_TIME, dt)
+            duration = max(0.01, PLAYER_ATTACK_APPROACH_DURATION)
             self.walk_progress += dt / duration
             self.walk_progress = min(self.walk_progress, 1.0)
             start_x = self.attack_start_x
             delta_x = self.attack_target_x - start_x
             self.position[0] = start_x + delta_x * self.walk_progress
             if self.walk_progress >= 1.0:
-                self.state = "attacking"
+                self.state = ANIM_ATTACKING
                 self.frame_index = 0
                 self.frame_timer = 0.0
                 self.walk_progress = 0.0
                 if not self.attack_sfx_played:
                     sound_manager.play_sfx("attack")
                     self.attack_sfx_played = True
-        elif self.state == "attacking":
+        elif self.state == ANIM_ATTACKING:
             frames = self.attack_frames
             if not frames:
-                self.state = "attack_return"
+                self.state = ANIM_ATTACK_RETURN
                 self.frame_index = 0
                 self.frame_timer = 0.0
                 self.walk_progress = 0.0
                 self.attack_return_start_x = self.position[0]
             else:
                 self.frame_timer += dt
-                if self.frame_timer >= self.attack_frame_time:
+                if self.frame_timer >= PLAYER_ATTACK_FRAME_TIME:
                     self.frame_timer = 0.0
                     self.frame_index += 1
                     if self.frame_index >= len(frames):
-                        self.state = "attack_return"
+                        self.state = ANIM_ATTACK_RETURN
                         self.frame_index = 0
                         self.frame_timer = 0.0
                         self.walk_progress = 0.0
                         self.attack_return_start_x = self.position[0]
-        elif self.state == "attack_return":
-            self._advance_frames(self.walk_frames, self.walk_frame_time, dt)
-            duration = max(0.01, self.attack_return_duration)
+        elif self.state == ANIM_ATTACK_RETURN:
+            self._advance_frames(self.walk_frames, PLAYER_WALK_FRAME_TIME, dt)
+            duration = max(0.01, PLAYER_ATTACK_RETURN_DURATION)
             self.walk_progress += dt / duration
             self.walk_progress = min(self.walk_progress, 1.0)
             start_x = self.attack_return_start_x
             delta_x = self.idle_x - start_x
             self.position[0] = start_x + delta_x * self.walk_progress
             if self.walk_progress >= 1.0:
-                self.state = "idle"
+                self.state = ANIM_IDLE
                 self.frame_index = 0
                 self.frame_timer = 0.0
                 self.attack_finished = True
@@ -368,49 +391,125 @@ class PlayerAnimator:
 
 
 # 敵人動畫目標高度與垂直偏移（讓野豬更大且略微靠下）
-ENEMY_DEFAULT_CONFIG = {
-    # Default enemies scale roughly to player size, no extra offsets
-    "target_height": 110,
-    "vertical_offset": 0,
-    "right_margin": 0,
-}
+@dataclass(frozen=True, slots=True)
+class EnemyVisualConfig:
+    target_height: int = 110
+    vertical_offset: int = 0
+    right_margin: int = 0
+    approach_frame_count: Optional[int] = None
+    attack_frame_count: Optional[int] = None
+    enemy_attack_gap: int = 0
+    player_attack_gap: int = 0
+
+
+# Default enemies scale roughly to player size, no extra offsets
+ENEMY_DEFAULT_CONFIG = EnemyVisualConfig()
 ENEMY_VISUAL_CONFIGS = {
     # Keep boar at the original larger scale
-    "wild_boar": {
-        "target_height": 230,
-        "vertical_offset": 60,
-        "right_margin": -20,
-    },
-    "axe_villager": {
-        "target_height": 110,
-        "vertical_offset": -5,
-        "right_margin": 10,
-        "approach_frame_count": 5,
-        "attack_frame_count": 2,
-    },
-    "villager": {
-        "target_height": 144,  # Enlarge static villager to match player idle scale
-        "vertical_offset": 20,
-        "right_margin": 0,
-    },
-    "variant": {
-        "target_height": 160,
-        "vertical_offset": 12,
-        "right_margin": 20,
-    },
-    "robot": {
-        "target_height": 230,
-        "vertical_offset": 45,  # slightly higher
-        "right_margin": -20,
-        "approach_frame_count": 2,
-        "attack_frame_count": 2,
+    "wild_boar": EnemyVisualConfig(
+        target_height=230,
+        vertical_offset=60,
+        right_margin=-20,
+    ),
+    "axe_villager": EnemyVisualConfig(
+        target_height=110,
+        vertical_offset=-5,
+        right_margin=10,
+        approach_frame_count=5,
+        attack_frame_count=2,
+    ),
+    "villager": EnemyVisualConfig(
+        target_height=144,  # Enlarge static villager to match player idle scale
+        vertical_offset=20,
+        right_margin=0,
+    ),
+    "variant": EnemyVisualConfig(
+        target_height=160,
+        vertical_offset=12,
+        right_margin=20,
+    ),
+    "robot": EnemyVisualConfig(
+        target_height=230,
+        vertical_offset=45,  # slightly higher
+        right_margin=-20,
+        approach_frame_count=2,
+        attack_frame_count=2,
         # Heavier transparent padding: push both sides closer during attacks.
-        "enemy_attack_gap": -30,
-        "player_attack_gap": 60,
-    },
+        enemy_attack_gap=-30,
+        player_attack_gap=60,
+    ),
 }
 
 
+# 敵人圖檔與縮放結果快取；同一批敵人會在多個事件間重複出現，讀取失敗也記為 None
+_ENEMY_IMAGE_CACHE: dict[str, Optional[pygame.Surface]] = {}
+_SCALED_ENEMY_FRAME_CACHE: dict[tuple[pygame.Surface, int], pygame.Surface] = {}
+
+
+# 開始選單閒置時於背景執行緒預先解碼所有敵人圖檔；convert_alpha 仍留給主執行緒
+_enemy_prefetch: Optional[Future] = None
+
+
+def _decode_enemy_images() -> dict[str, Optional[pygame.Surface]]:
+    from event_manager import ALL_EVENTS
+
+    names: dict[str, None] = {}
+    for event in ALL_EVENTS:
+        image_name = event.get("enemy_image")
+        if image_name:
+            names[image_name] = None
+        for frame_name in event.get("enemy_frames") or ():
+            names[frame_name] = None
+
+    decoded: dict[str, Optional[pygame.Surface]] = {}
+    for name in names:
+        try:
+            decoded[name] = pygame.image.load(res_path("assets", name))
+        except (FileNotFoundError, pygame.error):
+            decoded[name] = None
+    return decoded
+
+
+def start_enemy_image_prefetch() -> None:
+    global _enemy_prefetch
+    if _enemy_prefetch is not None:
+        return
+    executor = ThreadPoolExecutor(max_workers=1)
+    _enemy_prefetch = executor.submit(_decode_enemy_images)
+    executor.shutdown(wait=False)
+
+
+def _take_prefetched_enemy_image(
+    name: str,
+) -> tuple[bool, Optional[pygame.Surface]]:
+    """Return ``(found, surface)`` from a finished prefetch without blocking."""
+    if _enemy_prefetch is None or not _enemy_prefetch.done():
+        return False, None
+    try:
+        decoded = _enemy_prefetch.result()
+    except Exception:
+        return False, None
+    if name not in decoded:
+        return False, None
+    return True, decoded.pop(name)
+
+
+def load_enemy_image(name: str) -> Optional[pygame.Surface]:
+    """Load an enemy sprite once; returns ``None`` if it cannot be loaded."""
+    if name not in _ENEMY_IMAGE_CACHE:
+        cached: Optional[pygame.Surface] = None
+        found, decoded = _take_prefetched_enemy_image(name)
+        if found:
+            cached = decoded.convert_alpha() if decoded is not None else None
+        else:
+            try:
+                cached = pygame.image.load(res_path("assets", name)).convert_alpha()
+            except (FileNotFoundError, pygame.error):
+                pass
+        _ENEMY_IMAGE_CACHE[name] = cached
+    return _ENEMY_IMAGE_CACHE[name]
+
+
 class EnemyAnimator:
     def __init__(
         self,
@@ -429,6 +528,8 @@ class EnemyAnimator:
         self.attack_frame_count = attack_frame_count
         self.attack_gap = attack_gap
         self.frames: list[pygame.Surface] = []
+        self._source_frames: list[pygame.Surface] = []
+        self._source_height = target_height
         self.idle_frame: Optional[pygame.Surface] = None
         self.frame_index = 0
         self.frame_timer = 0.0
@@ -437,7 +538,7 @@ class EnemyAnimator:
         self.approach_duration = 0.32
         self.return_duration = 0.32
         self.attack_progress = 0.0
-        self.state = "idle"
+        self.state = ANIM_IDLE
         self.attack_finished = True
         self.attack_sfx_played = False
         self._reset_position()
@@ -445,61 +546,68 @@ class EnemyAnimator:
     def _scale_to_height(self, surface: pygame.Surface) -> pygame.Surface:
         width = surface.get_width()
         height = surface.get_height()
-        if height <= 0:
+        if height <= 0 or height == self.target_height:
             return surface
+        key = (surface, self.target_height)
+        cached = _SCALED_ENEMY_FRAME_CACHE.get(key)
+        if cached is not None:
+            return cached
         ratio = self.target_height / height
-        return pygame.transform.smoothscale(
+        scaled = pygame.transform.smoothscale(
             surface, (int(width * ratio), self.target_height)
         )
+        _SCALED_ENEMY_FRAME_CACHE[key] = scaled
+        return scaled
 
     def _reset_position(self, frame_size: Optional[tuple[int, int]] = None):
         frame_w, frame_h = (
             frame_size if frame_size else (self.target_height, self.target_height)
         )
-        self.base_y = UI_AREAS["image"].bottom - frame_h - 16 + self.vertical_offset
-        self.idle_x = UI_AREAS["image"].right - frame_w - self.right_margin
+        self.base_y = _IMAGE_BOTTOM - frame_h - 16 + self.vertical_offset
+        self.idle_x = _IMAGE_RIGHT - frame_w - self.right_margin
         self.position = [self.idle_x, self.base_y]
         self.attack_target_x = self.idle_x
         self.attack_start_x = self.idle_x
         self.attack_return_start_x = self.idle_x
 
-    def apply_config(
-        self,
-        *,
-        target_height: int,
-        vertical_offset: int,
-        right_margin: int,
-        approach_frame_count: Optional[int] = None,
-        attack_frame_count: Optional[int] = None,
-        attack_gap: int = 0,
-    ):
-        self.target_height = target_height
-        self.vertical_offset = vertical_offset
-        self.right_margin = right_margin
-        self.approach_frame_count = approach_frame_count
-        self.attack_frame_count = attack_frame_count
-        self.attack_gap = attack_gap
+    def apply_config(self, config: EnemyVisualConfig):
+        self.target_height = config.target_height
+        self.vertical_offset = config.vertical_offset
+        self.right_margin = config.right_margin
+        self.approach_frame_count = config.approach_frame_count
+        self.attack_frame_count = config.attack_frame_count
+        self.attack_gap = config.enemy_attack_gap
         self._reset_position()
 
     def clear(self):
         self.frames = []
+        self._source_frames = []
         self.idle_frame = None
         self.frame_index = 0
         self.frame_timer = 0.0
         self.attack_progress = 0.0
-        self.state = "idle"
+        self.state = ANIM_IDLE
         self.attack_finished = True
         self.attack_sfx_played = False
         self._reset_position()
 
     def set_frames(self, frames: list[pygame.Surface]):
-        scaled = [self._scale_to_height(frame) for frame in frames if frame]
+        # 同一組來源圖（Surface 以物件身分比較）且高度未變時沿用已縮放的畫格
+        if (
+            frames == self._source_frames
+            and self.target_height == self._source_height
+        ):
+            scaled = self.frames
+        else:
+            scaled = [self._scale_to_height(frame) for frame in frames if frame]
+            self._source_frames = list(frames)
+            self._source_height = self.target_height
         self.frames = scaled
         self.idle_frame = scaled[0] if scaled else None
         self.frame_index = 0
         self.frame_timer = 0.0
         self.attack_progress = 0.0
-        self.state = "idle"
+        self.state = ANIM_IDLE
         first = self.current_frame()
         if first:
             self._reset_position((first.get_width(), first.get_height()))
@@ -515,7 +623,7 @@ class EnemyAnimator:
         self.set_frames([frame])
 
     def current_frame(self) -> Optional[pygame.Surface]:
-        if self.state in {"attack_approach", "attacking", "attack_return"}:
+        if self.state >= ANIM_ATTACK_APPROACH:
             if self.frames:
                 return self.frames[self.frame_index % len(self.frames)]
         return self.idle_frame or (self.frames[0] if self.frames else None)
@@ -535,26 +643,28 @@ class EnemyAnimator:
         if player_position:
             player_x, player_y = player_position
         else:
-            player_x = UI_AREAS["image"].x + 32
-            player_y = UI_AREAS["image"].bottom - player_h - 16
+            player_x = _IMAGE_LEFT + 32
+            player_y = _IMAGE_BOTTOM - player_h - 16
 
         self.base_y = player_y + player_h - frame.get_height() + self.vertical_offset
         self.position[1] = self.base_y
         self.attack_start_x = self.idle_x
         target_x = player_x + player_w - 12 + self.attack_gap
-        min_x = UI_AREAS["image"].x + 24
+        min_x = _IMAGE_LEFT + 24
         max_x = self.idle_x - 12
         self.attack_target_x = max(min_x, min(target_x, max_x))
         self.attack_progress = 0.0
         self.frame_index = 0
         self.frame_timer = 0.0
-        self.state = "attack_approach"
+        self.state = ANIM_ATTACK_APPROACH
         self.attack_finished = False
         self.attack_sfx_played = False
         return True
 
     def update(self, dt: float):
-        if self.state == "attack_approach":
+        if dt <= 0.0:
+            return
+        if self.state == ANIM_ATTACK_APPROACH:
             segment_end = (
                 self.approach_frame_count
                 if self.approach_frame_count
@@ -573,15 +683,15 @@ class EnemyAnimator:
             delta_x = self.attack_target_x - self.attack_start_x
             self.position[0] = self.attack_start_x + delta_x * self.attack_progress
             if self.attack_progress >= 1.0:
-                self.state = "attacking"
+                self.state = ANIM_ATTACKING
                 self.frame_index = (
                     self.approach_frame_count if self.approach_frame_count else 0
                 )
                 self.frame_timer = 0.0
                 self.attack_progress = 0.0
-        elif self.state == "attacking":
+        elif self.state == ANIM_ATTACKING:
             if not self.frames:
-                self.state = "attack_return"
+                self.state = ANIM_ATTACK_RETURN
                 self.frame_index = 0
                 self.frame_timer = 0.0
                 self.attack_progress = 0.0
@@ -607,12 +717,12 @@ class EnemyAnimator:
                     if not self.attack_sfx_played:
                         sound_manager.play_sfx("attack")
                         self.attack_sfx_played = True
-                    self.state = "attack_return"
+                    self.state = ANIM_ATTACK_RETURN
                     self.frame_index = max(attack_start_index, attack_end_index - 1)
                     self.frame_timer = 0.0
                     self.attack_progress = 0.0
                     self.attack_return_start_x = self.position[0]
-        elif self.state == "attack_return":
+        elif self.state == ANIM_ATTACK_RETURN:
             self._advance_frames(self.attack_frame_time, dt)
             duration = max(0.01, self.return_duration)
             self.attack_progress += dt / duration
@@ -622,7 +732,7 @@ class EnemyAnimator:
                 self.attack_return_start_x + delta_x * self.attack_progress
             )
             if self.attack_progress >= 1.0:
-                self.state = "idle"
+                self.state = ANIM_IDLE
                 self.frame_index = 0
                 self.frame_timer = 0.0
                 self.position[0] = self.idle_x
@@ -633,13 +743,17 @@ class EnemyAnimator:
                 if self.frame_timer >= self.idle_frame_time:
                     self.frame_timer %= self.idle_frame_time
                     self.frame_index = (self.frame_index + 1) % len(self.frames)
-            self.position[0] = self.idle_x
-            self.position[1] = self.base_y
+            # 待機時位置通常已就定位，只在不同時才寫回
+            position = self.position
+            if position[0] != self.idle_x:
+                position[0] = self.idle_x
+            if position[1] != self.base_y:
+                position[1] = self.base_y
             if self.attack_finished is False:
                 self.attack_finished = True
 
     def is_attacking(self) -> bool:
-        return self.state in {"attack_approach", "attacking", "attack_return"}
+        return self.state >= ANIM_ATTACK_APPROACH
 
     def _advance_frames(self, frame_time: float, dt: float):
         if not self.frames:
@@ -740,12 +854,18 @@ icon = pygame.image.load(res_path("assets", "icon.png")).convert_alpha()
 pygame.display.set_icon(icon)
 game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
 SCREEN_RECT = game_surface.get_rect()
+# 主畫面各區塊之間露出的底色
+BACKDROP_COLOR = (30, 30, 30)
 clock = pygame.time.Clock()
 
 sound_manager.play_bgm(BGM_START_MENU)
 
 # 載入背景與標誌圖片
-start_bg = pygame.image.load(res_path("assets", "start_background.png"))
+start_bg = pygame.image.load(res_path("assets", "start_background.png")).convert()
+# 開始選單背景為不透明圖且蓋滿畫面時，就不必先以底色清空
+START_BG_COVERS_SCREEN = start_bg.get_rect(center=SCREEN_RECT.center).contains(
+    SCREEN_RECT
+)
 logo_image = pygame.image.load(res_path("assets", "logo1.png")).convert_alpha()
 logo_image = pygame.transform.scale(logo_image, (300, 300))
 
@@ -756,9 +876,9 @@ player_image = pygame.transform.scale(player_image, (96, 96))
 player_animator = PlayerAnimator(target_height=96)
 
 enemy_animator = EnemyAnimator(
-    target_height=ENEMY_DEFAULT_CONFIG["target_height"],
-    vertical_offset=ENEMY_DEFAULT_CONFIG["vertical_offset"],
-    right_margin=ENEMY_DEFAULT_CONFIG["right_margin"],
+    target_height=ENEMY_DEFAULT_CONFIG.target_height,
+    vertical_offset=ENEMY_DEFAULT_CONFIG.vertical_offset,
+    right_margin=ENEMY_DEFAULT_CONFIG.right_margin,
 )
 current_enemy_image = None  # 事件中目前使用的敵人立繪
 enemy_attack_active = False
@@ -767,6 +887,22 @@ enemy_attack_active = False
 FONT = pygame.font.Font(res_path("assets", "Cubic_11.ttf"), 20)
 SMALL_FONT = pygame.font.Font(res_path("assets", "Cubic_11.ttf"), 16)
 
+# 按鈕與設定視窗的文字種類有限，渲染結果依 (字型, 文字, 顏色) 快取
+_TEXT_RENDER_CACHE: dict[
+    tuple[pygame.font.Font, str, tuple[int, int, int]], pygame.Surface
+] = {}
+
+
+def render_cached(
+    font: pygame.font.Font, text: str, color=(255, 255, 255)
+) -> pygame.Surface:
+    key = (font, text, tuple(color))
+    cached = _TEXT_RENDER_CACHE.get(key)
+    if cached is None:
+        cached = font.render(text, True, color)
+        _TEXT_RENDER_CACHE[key] = cached
+    return cached
+
 # 開始選單按鈕
 button_width = 200
 button_height = 50
@@ -836,6 +972,19 @@ def present_game_surface() -> None:
     pygame.display.flip()
 
 
+# 淡入淡出共用一張黑色遮罩，以整面 alpha 調整深淺，不必每幀重建
+_fade_overlay: Optional[pygame.Surface] = None
+
+
+def draw_fade_overlay(surface: pygame.Surface, alpha: float) -> None:
+    global _fade_overlay
+    if _fade_overlay is None or _fade_overlay.get_size() != surface.get_size():
+        _fade_overlay = pygame.Surface(surface.get_size()).convert()
+        _fade_overlay.fill((0, 0, 0))
+    _fade_overlay.set_alpha(int(alpha))
+    surface.blit(_fade_overlay, (0, 0))
+
+
 def use_inventory_item(player: dict, index: int) -> bool:
     """Use the item at ``index`` in the player's inventory if possible."""
     inventory = player.get("inventory")
@@ -848,10 +997,20 @@ def use_inventory_item(player: dict, index: int) -> bool:
     return False
 
 
+# 設定視窗版面只取決於遊戲畫面大小與是否顯示導覽按鈕，算一次即可重複使用
+_SETTINGS_LAYOUT_CACHE: dict[tuple[tuple[int, int], bool], dict] = {}
+
+
 def get_settings_layout(include_navigation: bool):
+    surface_size = game_surface.get_size()
+    cache_key = (surface_size, include_navigation)
+    cached = _SETTINGS_LAYOUT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     modal_width = 340
     modal_height = 324 + (130 if include_navigation else 0)
-    screen_width, screen_height = game_surface.get_size()
+    screen_width, screen_height = surface_size
     modal_rect = pygame.Rect(
         (screen_width - modal_width) // 2,
         (screen_height - modal_height) // 2,
@@ -943,6 +1102,7 @@ def get_settings_layout(include_navigation: bool):
             button_height,
         )
 
+    _SETTINGS_LAYOUT_CACHE[cache_key] = controls
     return controls
 
 
@@ -955,26 +1115,41 @@ def draw_button(
     font=FONT,
 ):
     pygame.draw.rect(surface, color, rect, border_radius=6)
-    text_surface = font.render(label, True, (255, 255, 255))
+    text_surface = render_cached(font, label)
     surface.blit(text_surface, text_surface.get_rect(center=rect.center))
 
 
+# 設定視窗的底板、外框與標題不會變動，依視窗大小預先畫好一張
+_SETTINGS_CHROME_CACHE: dict[tuple[int, int], pygame.Surface] = {}
+
+
+def _get_settings_chrome(size: tuple[int, int]) -> pygame.Surface:
+    cached = _SETTINGS_CHROME_CACHE.get(size)
+    if cached is not None:
+        return cached
+    chrome = pygame.Surface(size, pygame.SRCALPHA)
+    chrome_rect = chrome.get_rect()
+    pygame.draw.rect(chrome, (40, 40, 60), chrome_rect, border_radius=8)
+    pygame.draw.rect(chrome, (120, 120, 140), chrome_rect, 2, border_radius=8)
+    title = FONT.render("設定", True, (255, 255, 255))
+    chrome.blit(title, title.get_rect(center=(chrome_rect.centerx, 24)))
+    chrome = chrome.convert_alpha()
+    _SETTINGS_CHROME_CACHE[size] = chrome
+    return chrome
+
+
 def draw_settings_popup(surface: pygame.Surface, include_navigation: bool):
     controls = get_settings_layout(include_navigation)
     label_x = controls["label_x"]
     label_width = controls["label_width"]
     toggle_center_x = controls["typewriter_toggle"].centerx
     modal = controls["modal"]
-    pygame.draw.rect(surface, (40, 40, 60), modal, border_radius=8)
-    pygame.draw.rect(surface, (120, 120, 140), modal, 2, border_radius=8)
-
-    title = FONT.render("設定", True, (255, 255, 255))
-    surface.blit(title, title.get_rect(center=(modal.centerx, modal.y + 24)))
+    surface.blit(_get_settings_chrome(modal.size), modal.topleft)
 
     def draw_volume_row(
         label: str, down_rect: pygame.Rect, up_rect: pygame.Rect, value: float
     ):
-        label_surface = SMALL_FONT.render(label, True, (230, 230, 230))
+        label_surface = render_cached(SMALL_FONT, label, (230, 230, 230))
         label_rect = label_surface.get_rect(
             midleft=(label_x, down_rect.y + 14)
         )
@@ -982,7 +1157,7 @@ def draw_settings_popup(surface: pygame.Surface, include_navigation: bool):
         surface.blit(label_surface, label_rect)
         draw_button(surface, down_rect, "-", font=SMALL_FONT)
         draw_button(surface, up_rect, "+", font=SMALL_FONT)
-        value_surface = SMALL_FONT.render(f"{int(value * 100)}%", True, (255, 255, 255))
+        value_surface = render_cached(SMALL_FONT, f"{int(value * 100)}%")
         surface.blit(
             value_surface,
             value_surface.get_rect(center=(toggle_center_x, down_rect.centery)),
@@ -1004,7 +1179,7 @@ def draw_settings_popup(surface: pygame.Surface, include_navigation: bool):
     typewriter_rect = controls["typewriter_toggle"]
     typewriter_state = text_log.is_typewriter_enabled()
     state_text = "開啟" if typewriter_state else "關閉"
-    label_surface = SMALL_FONT.render(typewriter_label, True, (230, 230, 230))
+    label_surface = render_cached(SMALL_FONT, typewriter_label, (230, 230, 230))
     label_rect = label_surface.get_rect(midleft=(label_x, typewriter_rect.y + 16))
     label_rect.width = label_width
     surface.blit(label_surface, label_rect)
@@ -1020,7 +1195,7 @@ def draw_settings_popup(surface: pygame.Surface, include_navigation: bool):
     devlog_rect = controls["devlog_toggle"]
     devlog_state = text_log.is_dev_log_enabled()
     devlog_text = "開啟" if devlog_state else "關閉"
-    label_surface = SMALL_FONT.render(devlog_label, True, (230, 230, 230))
+    label_surface = render_cached(SMALL_FONT, devlog_label, (230, 230, 230))
     label_rect = label_surface.get_rect(midleft=(label_x, devlog_rect.y + 16))
     label_rect.width = label_width
     surface.blit(label_surface, label_rect)
@@ -1070,13 +1245,13 @@ def handle_settings_click(pos, include_navigation: bool):
 
     if include_navigation:
         if controls["to_menu"].collidepoint(pos):
-            persist_game_state()
+            persist_game_state(force=True)
             show_settings_popup = False
             game_state = "start_menu"
             sound_manager.play_bgm(BGM_START_MENU)
             return True
         if controls["quit"].collidepoint(pos):
-            persist_game_state()
+            persist_game_state(force=True)
             pygame.quit()
             sys.exit()
 
@@ -1098,46 +1273,47 @@ def _derive_enemy_key_from_path(path: str) -> Optional[str]:
     return stem
 
 
-def get_enemy_visual_config(event_data) -> dict:
+# 圖檔路徑 → 對應的敵人外觀設定（找不到時為 None），事件間重複使用同一批路徑
+_ENEMY_CONFIG_BY_IMAGE: dict[str, Optional[EnemyVisualConfig]] = {}
+
+
+def _enemy_config_for_image(name: str) -> Optional[EnemyVisualConfig]:
+    if name not in _ENEMY_CONFIG_BY_IMAGE:
+        key = _derive_enemy_key_from_path(name)
+        _ENEMY_CONFIG_BY_IMAGE[name] = ENEMY_VISUAL_CONFIGS.get(key) if key else None
+    return _ENEMY_CONFIG_BY_IMAGE[name]
+
+
+def get_enemy_visual_config(event_data) -> EnemyVisualConfig:
     if not event_data:
         return ENEMY_DEFAULT_CONFIG
-    image_candidates: list[str] = []
     image_name = event_data.get("enemy_image")
     if image_name:
-        image_candidates.append(image_name)
-    frame_names = event_data.get("enemy_frames") or []
-    image_candidates.extend(frame_names)
-    for name in image_candidates:
-        key = _derive_enemy_key_from_path(name)
-        if key and key in ENEMY_VISUAL_CONFIGS:
-            return ENEMY_VISUAL_CONFIGS[key]
+        config = _enemy_config_for_image(image_name)
+        if config is not None:
+            return config
+    for name in event_data.get("enemy_frames") or ():
+        config = _enemy_config_for_image(name)
+        if config is not None:
+            return config
     return ENEMY_DEFAULT_CONFIG
 
 
-def load_enemy_assets_from_event(event_data, *, config: dict):
+def load_enemy_assets_from_event(event_data, *, config: EnemyVisualConfig):
     if not event_data:
         return None, []
     primary_image = None
     frames: list[pygame.Surface] = []
     frame_names = event_data.get("enemy_frames") or []
     for name in frame_names:
-        try:
-            frame_surface = pygame.image.load(res_path("assets", name)).convert_alpha()
-        except (FileNotFoundError, pygame.error):
-            continue
-        frames.append(frame_surface)
+        frame_surface = load_enemy_image(name)
+        if frame_surface is not None:
+            frames.append(frame_surface)
     if frames:
         primary_image = frames[0]
     image_name = event_data.get("enemy_image")
     if primary_image is None and image_name:
-        try:
-            image_surface = pygame.image.load(
-                res_path("assets", image_name)
-            ).convert_alpha()
-        except (FileNotFoundError, pygame.error):
-            primary_image = None
-        else:
-            primary_image = image_surface
+        primary_image = load_enemy_image(image_name)
     return primary_image, frames
 
 
@@ -1146,19 +1322,8 @@ def update_enemy_visuals(event_data):
     global current_enemy_image
 
     config = get_enemy_visual_config(event_data)
-    enemy_animator.apply_config(
-        target_height=config.get(
-            "target_height", ENEMY_DEFAULT_CONFIG["target_height"]
-        ),
-        vertical_offset=config.get(
-            "vertical_offset", ENEMY_DEFAULT_CONFIG["vertical_offset"]
-        ),
-        right_margin=config.get("right_margin", ENEMY_DEFAULT_CONFIG["right_margin"]),
-        approach_frame_count=config.get("approach_frame_count"),
-        attack_frame_count=config.get("attack_frame_count"),
-        attack_gap=config.get("enemy_attack_gap", 0),
-    )
-    player_animator.attack_gap = config.get("player_attack_gap", 0)
+    enemy_animator.apply_config(config)
+    player_animator.attack_gap = config.player_attack_gap
 
     current_enemy_image, frames = load_enemy_assets_from_event(
         event_data, config=config
@@ -1219,9 +1384,12 @@ def apply_event_on_enter_effects(player: dict, event: Optional[dict]) -> None:
             if item in inventory:
 
                 def _apply_loss(item_name=item):
-                    if item_name in inventory:
+                    # 單次掃描：直接 remove，不存在時略過
+                    try:
                         inventory.remove(item_name)
-                        sound_manager.play_sfx("pickup")
+                    except ValueError:
+                        return
+                    sound_manager.play_sfx("pickup")
 
                 text_log.add(
                     f"你失去了道具:{item}",
@@ -1232,10 +1400,24 @@ def apply_event_on_enter_effects(player: dict, event: Optional[dict]) -> None:
     event["_on_enter_applied"] = True
 
 
-def persist_game_state():
+# 主迴圈每幀都會要求存檔；兩次實際寫檔至少相隔 SAVE_MIN_INTERVAL_MS
+_last_save_ms: Optional[int] = None
+
+
+def persist_game_state(force: bool = False):
+    global _last_save_ms
     if game_state != "main_screen":
         return
 
+    now = pygame.time.get_ticks()
+    if (
+        not force
+        and _last_save_ms is not None
+        and now - _last_save_ms < SAVE_MIN_INTERVAL_MS
+    ):
+        return
+    _last_save_ms = now
+
     save_manager.save_game(
         {
             "player": player,
@@ -1269,11 +1451,7 @@ def start_new_adventure():
     pending_clear_event = False
     clear_event_timer = 0
     current_enemy_image = None
-    enemy_animator.apply_config(
-        target_height=ENEMY_DEFAULT_CONFIG["target_height"],
-        vertical_offset=ENEMY_DEFAULT_CONFIG["vertical_offset"],
-        right_margin=ENEMY_DEFAULT_CONFIG["right_margin"],
-    )
+    enemy_animator.apply_config(ENEMY_DEFAULT_CONFIG)
     enemy_animator.clear()
     enemy_attack_active = False
     current_background_name = DEFAULT_BACKGROUND
@@ -1389,6 +1567,7 @@ def apply_result_and_advance(result, *, from_battle_action: bool = False) -> boo
     handle_event_result(player, result)
     text_log.scroll_to_bottom()
 
+    game_surface.fill(BACKDROP_COLOR)
     render_ui(
         game_surface,
         player,
@@ -1540,13 +1719,11 @@ enemy_attack_active = False
 ending_exit_timer = 0
 ending_fade_alpha = 0.0
 intro_fade_alpha = 0.0
+start_enemy_image_prefetch()
 
 # 主要遊戲迴圈
 running = True
 while running:
-    # 清空畫面
-    game_surface.fill((30, 30, 30))
-
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
@@ -1645,9 +1822,6 @@ while running:
                     and current_event
                     and "options" in current_event
                 ):
-                    option_rects = get_option_rects(
-                        sub_state, current_event, player, areas
-                    )
                     if text_log.is_typewriter_animating() and any(
                         rect.collidepoint(game_pos) for rect in option_rects
                     ):
@@ -1692,23 +1866,6 @@ while running:
                                     )
                                 pending_result = result
                                 pending_result_requires_attack = wait_for_attack
-                                # 立即重繪以顯示選擇或攻擊起手
-                                render_ui(
-                                    game_surface,
-                                    player,
-                                    FONT,
-                                    current_event,
-                                    current_background_name,
-                                    sub_state,
-                                    player_animator.current_frame() or player_image,
-                                    enemy_animator.current_frame()
-                                    or current_enemy_image,
-                                    player_position=tuple(player_animator.position),
-                                    enemy_position=tuple(enemy_animator.position),
-                                    mouse_pos=game_pos,
-                                    allow_hover=not show_settings_popup,
-                                )
-                                present_game_surface()
                                 try_apply_pending_result(force=not wait_for_attack)
                                 handled_click = True
                                 break
@@ -1723,23 +1880,7 @@ while running:
                             slot.rect.collidepoint(game_pos)
                             and slot.item_index is not None
                         ):
-                            if use_inventory_item(player, slot.item_index):
-                                render_ui(
-                                    game_surface,
-                                    player,
-                                    FONT,
-                                    current_event,
-                                    current_background_name,
-                                    sub_state,
-                                    player_animator.current_frame() or player_image,
-                                    enemy_animator.current_frame()
-                                    or current_enemy_image,
-                                    player_position=tuple(player_animator.position),
-                                    enemy_position=tuple(enemy_animator.position),
-                                    mouse_pos=game_pos,
-                                    allow_hover=not show_settings_popup,
-                                )
-                                present_game_surface()
+                            use_inventory_item(player, slot.item_index)
                             break
         elif event.type == pygame.MOUSEWHEEL:
             game_mouse_pos = window_to_game_pos(pygame.mouse.get_pos())
@@ -1867,6 +2008,8 @@ while running:
     # 繪製對應畫面
     current_mouse_pos = window_to_game_pos(pygame.mouse.get_pos())
     if game_state == "start_menu":
+        if not START_BG_COVERS_SCREEN:
+            game_surface.fill(BACKDROP_COLOR)
         game_surface.blit(start_bg, start_bg.get_rect(center=SCREEN_RECT.center))
         game_surface.blit(logo_image, (100, 80))
 
@@ -1886,6 +2029,7 @@ while running:
         )
         game_surface.blit(summary_surface, summary_rect)
     elif game_state == "main_screen":
+        game_surface.fill(BACKDROP_COLOR)
         render_ui(
             game_surface,
             player,
@@ -1904,17 +2048,11 @@ while running:
     if show_settings_popup:
         draw_settings_popup(game_surface, game_state == "main_screen")
     if player_animator.fade_alpha > 0:
-        fade_surface = pygame.Surface(game_surface.get_size(), pygame.SRCALPHA)
-        fade_surface.fill((0, 0, 0, player_animator.fade_alpha))
-        game_surface.blit(fade_surface, (0, 0))
+        draw_fade_overlay(game_surface, player_animator.fade_alpha)
     if ending_fade_alpha > 0:
-        fade_surface = pygame.Surface(game_surface.get_size(), pygame.SRCALPHA)
-        fade_surface.fill((0, 0, 0, int(ending_fade_alpha)))
-        game_surface.blit(fade_surface, (0, 0))
+        draw_fade_overlay(game_surface, ending_fade_alpha)
     if intro_fade_alpha > 0:
-        fade_surface = pygame.Surface(game_surface.get_size(), pygame.SRCALPHA)
-        fade_surface.fill((0, 0, 0, int(intro_fade_alpha)))
-        game_surface.blit(fade_surface, (0, 0))
+        draw_fade_overlay(game_surface, intro_fade_alpha)
     persist_game_state()
     present_game_surface()
 
@@ -1960,5 +2098,6 @@ while running:
         game_state = "start_menu"
         sound_manager.play_bgm(BGM_START_MENU)
 
+persist_game_state(force=True)
 pygame.quit()
 sys.exit()
@@ -24,3 +24,20 @@ def init_player_state() -> Dict:
         "event_cooldowns": {},  # 事件冷卻計數
         "consumed_events": set(),
     }
+
+
+def migrate_player(player: Dict) -> Dict:
+    """
+    Normalise a player dict restored from disk in place.
+
+    JSON saves store sets as lists; converting them once here lets the
+    event filters use plain membership tests without re-checking types.
+    """
+    consumed = player.get("consumed_events")
+    if not isinstance(consumed, set):
+        player["consumed_events"] = set(consumed or ())
+    if not isinstance(player.get("flags"), dict):
+        player["flags"] = {}
+    if not isinstance(player.get("event_cooldowns"), dict):
+        player["event_cooldowns"] = {}
+    return player
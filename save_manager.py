@@ -3,15 +3,25 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict, is_dataclass
 from typing import Any, Dict
 
 from pathlib import Path
 
 from paths import user_data_path
+from player_state import migrate_player
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+_SAVE_FILE = Path(user_data_path("save.json"))
 
 
 def _save_file() -> Path:
-    return Path(user_data_path("save.json"))
+    return _SAVE_FILE
 
 
 def has_save() -> bool:
@@ -21,6 +31,8 @@ def has_save() -> bool:
 def _to_json_safe(value: Any) -> Any:
     if isinstance(value, set):
         return sorted(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return _to_json_safe(asdict(value))
     if isinstance(value, dict):
         return {key: _to_json_safe(val) for key, val in value.items()}
     if isinstance(value, (list, tuple)):
@@ -35,10 +47,21 @@ def _serialize_player(player: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _deserialize_player(data: Dict[str, Any]) -> Dict[str, Any]:
-    player = dict(data)
-    if "consumed_events" in player and isinstance(player["consumed_events"], list):
-        player["consumed_events"] = set(player["consumed_events"])
-    return player
+    return migrate_player(dict(data))
+
+
+def _encode(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _decode(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def save_game(payload: Dict[str, Any]) -> None:
@@ -53,8 +76,9 @@ def save_game(payload: Dict[str, Any]) -> None:
         if isinstance(player, dict):
             serializable["player"] = _serialize_player(player)
 
-        with temp_file.open("w", encoding="utf-8") as f:
-            json.dump(serializable, f, ensure_ascii=False, indent=2)
+        # 先在記憶體中編碼完成，再一次寫入檔案
+        with temp_file.open("wb") as f:
+            f.write(_encode(serializable))
 
         temp_file.replace(save_file)
     except (OSError, TypeError, ValueError):
@@ -71,7 +95,7 @@ def load_game() -> Dict[str, Any] | None:
         return None
 
     try:
-        data = json.loads(save_file.read_text(encoding="utf-8"))
+        data = _decode(save_file.read_bytes())
     except (OSError, json.JSONDecodeError):
         return None
 
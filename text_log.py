@@ -10,7 +10,7 @@ current scroll offset.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+from typing import Callable, Iterable, List, Optional
 
 import settings_manager
 
@@ -119,6 +119,28 @@ def add(
     _enqueue(LogEntry(message, category=category, event_id=event_id, on_show=on_show))
 
 
+def add_many(
+    messages: Iterable[str],
+    *,
+    category: str = "narration",
+    event_id: int | None = None,
+) -> None:
+    """Queue several messages that share one category, in order."""
+    if category in _DEV_LOG_CATEGORIES and not _dev_log_enabled:
+        return
+    if event_id is None:
+        event_id = _current_event_id
+    entries = iter(
+        [LogEntry(message, category=category, event_id=event_id) for message in messages]
+    )
+    for entry in entries:
+        _enqueue(entry)
+        if _active_entry:
+            # 打字機已在播放，其餘訊息直接排入佇列
+            _pending_entries.extend(entries)
+            break
+
+
 def scroll_to_bottom() -> None:
     global log_offset
     log_offset = 0
@@ -160,6 +182,20 @@ def clear_history() -> None:
     _invalidate_wrap_cache()
 
 
+def clear_history_if_dirty() -> None:
+    """Like ``clear_history`` but skips the wrap-cache reset when already clear."""
+
+    if (
+        log_history
+        or _pending_entries
+        or _active_entry
+        or _current_event_id is not None
+        or _next_event_id != 1
+        or log_offset
+    ):
+        clear_history()
+
+
 def get_current_event_id() -> int | None:
     return _current_event_id
 
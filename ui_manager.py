@@ -4,7 +4,7 @@ import pygame
 import text_log
 
 from paths import res_path
-from battle_system import DEFAULT_DURABILITY
+from battle_system import DEFAULT_DURABILITY, get_battle_state
 
 
 def is_cinematic_mode(player: dict) -> bool:
@@ -82,6 +82,11 @@ def _load_background(name: str) -> pygame.Surface:
         _BACKGROUND_CACHE[name] = fallback
         return fallback
     scaled = pygame.transform.scale(loaded, UI_AREAS["image"].size)
+    # 轉成顯示格式，避免每幀 blit 時再做像素格式轉換
+    if loaded.get_flags() & pygame.SRCALPHA:
+        scaled = scaled.convert_alpha()
+    else:
+        scaled = scaled.convert()
     _BACKGROUND_CACHE[name] = scaled
     return scaled
 
@@ -247,10 +252,10 @@ def _get_durability_display(player: dict) -> tuple[int, int]:
     if not player:
         return DEFAULT_DURABILITY, DEFAULT_DURABILITY
 
-    battle_state = player.get("battle_state") or {}
+    battle_state = get_battle_state(player)
     if battle_state:
-        current = int(battle_state.get("durability", DEFAULT_DURABILITY))
-        maximum = int(battle_state.get("max_durability", DEFAULT_DURABILITY))
+        current = int(battle_state.durability)
+        maximum = int(battle_state.max_durability)
         if maximum <= 0:
             maximum = DEFAULT_DURABILITY
         current = max(0, min(current, maximum))
@@ -433,7 +438,8 @@ def render_ui(
     old_clip = screen.get_clip()
     screen.set_clip(areas["image"])
     background = get_background_surface(background_name)
-    screen.blit(background, areas["image"].topleft)
+    # 背景與角色一次以 blits 送出，減少逐張呼叫
+    image_blits = [(background, areas["image"].topleft)]
 
     # 若有傳入立繪則繪製玩家與敵人（結局動畫不繪製）
     player_bottom = areas["image"].bottom - 16
@@ -447,7 +453,7 @@ def render_ui(
                 areas["image"].bottom - player_height - 16,
             )
         player_bottom = player_pos[1] + player_image.get_height()
-        screen.blit(player_image, player_pos)
+        image_blits.append((player_image, player_pos))
     enemy_rect: Optional[pygame.Rect] = None
     if enemy_image and not ending_cinematic:
         enemy_rect = enemy_image.get_rect()
@@ -456,7 +462,8 @@ def render_ui(
         else:
             enemy_rect.x = areas["image"].right - enemy_rect.width - 32
             enemy_rect.bottom = player_bottom
-        screen.blit(enemy_image, enemy_rect.topleft)
+        image_blits.append((enemy_image, enemy_rect.topleft))
+    screen.blits(image_blits, doreturn=False)
     # 恢復全局裁切，後續 UI 不受限
     screen.set_clip(old_clip)
 